@@ -0,0 +1,13 @@
+"""
+Puts this checkout first on sys.path, so the benchmarks measure the package in
+the repository whether or not pytopvisor is installed. Imported by every script
+before pytopvisor.
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
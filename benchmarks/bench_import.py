@@ -0,0 +1,69 @@
+"""
+Measures the cold import time of pytopvisor in fresh interpreters.
+
+Fails (exit code 1) if importing the client pulls in the HTTP transport or
+logging handlers eagerly, or if the import is slower than --max-ms.
+
+Usage: python benchmarks/bench_import.py [--repeat N] [--max-ms MS]
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# The probe runs from the checkout, so it imports the package in it whether or not pytopvisor is installed
+from _path import REPO_ROOT
+
+
+IMPORT_STATEMENT = "import pytopvisor.topvisor"
+
+# Modules that must not be loaded just by importing the client
+DEFERRED_MODULES = ("requests", "httpx", "pytopvisor.services.api", "pytopvisor.services.projects")
+
+PROBE = f"""
+import json, sys, time
+baseline = time.perf_counter()
+{IMPORT_STATEMENT}
+elapsed = time.perf_counter() - baseline
+import logging
+handlers = logging.getLogger("TopvisorLogger").handlers
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [name for name in {DEFERRED_MODULES!r} if name in sys.modules],
+    "handlers": len(handlers),
+}}))
+"""
+
+
+def bench_import(repeat=10):
+    """
+    Returns the best import time in milliseconds and the probe result of the last run.
+    """
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE], check=True, capture_output=True, text=True, cwd=REPO_ROOT
+        ).stdout
+        result = json.loads(output)
+        best = result["seconds"] if best is None else min(best, result["seconds"])
+    return best * 1000, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh interpreters to start")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if the import is slower")
+    args = parser.parse_args()
+    milliseconds, result = bench_import(args.repeat)
+    print(f"{IMPORT_STATEMENT}: {milliseconds:.1f} ms (best of {args.repeat})")
+
+    problems = []
+    if result["loaded"]:
+        problems.append(f"eagerly imported: {', '.join(result['loaded'])}")
+    if result["handlers"]:
+        problems.append("logging handlers configured at import time")
+    if args.max_ms is not None and milliseconds > args.max_ms:
+        problems.append(f"slower than {args.max_ms} ms")
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    sys.exit(1 if problems else 0)
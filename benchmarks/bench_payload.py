@@ -0,0 +1,66 @@
+"""
+Measures per-call overhead of payload construction.
+
+Usage: python benchmarks/bench_payload.py [--number N]
+"""
+import argparse
+import timeit
+
+import _path  # noqa: F401
+
+from pytopvisor.utils.payload import PayloadFactory
+
+
+# Shaped like the locals() of PositionsService.get_positions_history
+POSITIONS_HISTORY_LOCALS = {
+    "self": None,
+    "project_id": 1,
+    "regions_indexes": [1, 2, 3],
+    "dates": None,
+    "date1": "2024-01-01",
+    "date2": "2024-02-01",
+    "competitors_ids": [1, 2],
+    "type_range": None,
+    "count_dates": None,
+    "only_exists_first_date": None,
+    "show_headers": True,
+    "show_exists_dates": None,
+    "show_visitors": None,
+    "show_top_by_depth": None,
+    "positions_fields": ["position", "url"],
+    "filter_by_dynamic": None,
+    "filter_by_positions": [[1, 10], [11, 20]],
+    "window_days": None,
+    "kwargs": {"fetch_all": False, "limit": 10000},
+}
+
+
+def bench_payload(number=100000):
+    """
+    Returns the average time in microseconds to build a get_positions_history payload,
+    from a full parameter dict and from a template.
+    """
+    template = PayloadFactory.template(
+        "positions_get_history",
+        regions_indexes=[1, 2, 3],
+        date1="2024-01-01",
+        date2="2024-02-01",
+        show_headers=True,
+    )
+    build = min(
+        timeit.repeat(
+            lambda: PayloadFactory.build("positions_get_history", POSITIONS_HISTORY_LOCALS),
+            number=number,
+            repeat=3,
+        )
+    )
+    from_template = min(timeit.repeat(lambda: template.build(project_id=1), number=number, repeat=3))
+    return build / number * 1e6, from_template / number * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000, help="Calls per measurement")
+    args = parser.parse_args()
+    build, from_template = bench_payload(args.number)
+    print(f"get_positions_history payload: {build:.2f} us/call, from template: {from_template:.2f} us/call")
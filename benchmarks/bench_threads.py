@@ -0,0 +1,136 @@
+"""
+Stress test of one Topvisor client shared by a thread pool.
+
+For every thread count, the same batch of get_competitors calls is run twice
+against an in-process mock API with a fixed latency: once through a single
+client shared by all workers and once with a separate client per thread.
+Every response is checked against the project it was requested for, and the
+shared client's MetricsCollector must have seen every request, so crossed
+responses or lost events fail the run (exit code 1). Throughput should grow
+roughly linearly with the thread count while the mock latency dominates; at
+high counts the CPU time of the client and of the in-process server, which
+share the GIL, becomes the limit.
+
+Usage: python benchmarks/bench_threads.py [--threads 1,2,4,8,16,32] [--requests 512] [--latency 0.02]
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import _path  # noqa: F401
+
+from pytopvisor import Topvisor, configure_logging
+from pytopvisor.utils.metrics import MetricsCollector
+
+from mock_server import MockConfig, MockServer
+
+
+def check(project_id, response):
+    """
+    Returns True if the competitors in the response belong to the requested project.
+    """
+    result = response["result"]
+    return bool(result) and all(item["id"] // 1000 == project_id for item in result)
+
+
+def make_client(url, threads, **options):
+    client = Topvisor(
+        "bench",
+        "bench",
+        pool_maxsize=max(threads, 10),
+        pool_block=True,
+        **options,
+    )
+    client.api_client.base_url = url
+    return client
+
+
+def run_shared(server, threads, requests):
+    metrics = MetricsCollector()
+    with make_client(server.url, threads, hooks=[metrics]) as client:
+
+        def call(project_id):
+            return check(project_id, client.run_task("get_competitors", project_id=project_id))
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            started = time.perf_counter()
+            valid = sum(executor.map(call, range(1, requests + 1)))
+            elapsed = time.perf_counter() - started
+    seen = sum(endpoint["requests"] for endpoint in metrics.snapshot()["endpoints"].values())
+    return elapsed, valid, seen
+
+
+def run_per_thread(server, threads, requests):
+    local = threading.local()
+    clients = []
+    clients_lock = threading.Lock()
+
+    def call(project_id):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = make_client(server.url, 1)
+            with clients_lock:
+                clients.append(client)
+        return check(project_id, client.run_task("get_competitors", project_id=project_id))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        valid = sum(executor.map(call, range(1, requests + 1)))
+        elapsed = time.perf_counter() - started
+    for client in clients:
+        client.close()
+    return elapsed, valid, requests
+
+
+def bench_threads(thread_counts, requests, latency):
+    """
+    Returns {threads: {mode: {"requests_per_second", "connections", "valid", "events"}}}.
+    """
+    results = {}
+    with MockServer(MockConfig(competitors=20, latency=latency)) as server:
+        for threads in thread_counts:
+            results[threads] = {}
+            for mode, runner in (("shared", run_shared), ("per_thread", run_per_thread)):
+                connections = server.config.connections
+                elapsed, valid, events = runner(server, threads, requests)
+                results[threads][mode] = {
+                    "requests_per_second": requests / elapsed,
+                    "connections": server.config.connections - connections,
+                    "valid": valid,
+                    "events": events,
+                }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", default="1,2,4,8,16,32", help="Comma-separated thread counts")
+    parser.add_argument("--requests", type=int, default=512, help="Calls per thread count and mode")
+    parser.add_argument("--latency", type=float, default=0.02, help="Mock server latency, s")
+    args = parser.parse_args()
+    configure_logging(handlers=[logging.NullHandler()])
+
+    thread_counts = [int(value) for value in args.threads.split(",")]
+    results = bench_threads(thread_counts, args.requests, args.latency)
+
+    baseline = results[thread_counts[0]]["shared"]["requests_per_second"] / thread_counts[0]
+    print(f"{'threads':>7} {'shared req/s':>13} {'scaling':>8} {'conns':>6} {'per-thread req/s':>17} {'conns':>6}")
+    problems = []
+    for threads, modes in results.items():
+        shared, per_thread = modes["shared"], modes["per_thread"]
+        print(
+            f"{threads:>7} {shared['requests_per_second']:>13.1f} "
+            f"{shared['requests_per_second'] / (baseline * threads):>7.0%} {shared['connections']:>6} "
+            f"{per_thread['requests_per_second']:>17.1f} {per_thread['connections']:>6}"
+        )
+        for mode, result in modes.items():
+            if result["valid"] != args.requests:
+                problems.append(f"{mode}, {threads} threads: {args.requests - result['valid']} wrong responses")
+            if result["events"] != args.requests:
+                problems.append(f"{mode}, {threads} threads: {result['events']} of {args.requests} hook events")
+    if problems:
+        print("FAIL: " + "; ".join(problems))
+        sys.exit(1)
@@ -0,0 +1,47 @@
+"""
+Measures per-call overhead of request validation.
+
+Usage: python benchmarks/bench_validation.py [--number N]
+"""
+import argparse
+import timeit
+
+import _path  # noqa: F401
+
+from pytopvisor.utils.validators import Validator
+
+
+POSITIONS_HISTORY_PARAMS = {
+    "project_id": 1,
+    "regions_indexes": [1, 2, 3],
+    "date1": "2024-01-01",
+    "date2": "2024-02-01",
+    "competitors_ids": [1, 2],
+    "type_range": 2,
+    "show_headers": True,
+    "positions_fields": ["position", "url"],
+    "filter_by_positions": [[1, 10], [11, 20]],
+}
+
+
+def bench_validation(number=100000):
+    """
+    Returns the average validation time of get_positions_history in microseconds.
+    """
+    Validator.compile("get_positions_history")
+    seconds = min(
+        timeit.repeat(
+            lambda: Validator.validate("get_positions_history", **POSITIONS_HISTORY_PARAMS),
+            number=number,
+            repeat=3,
+        )
+    )
+    return seconds / number * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000, help="Calls per measurement")
+    args = parser.parse_args()
+    per_call = bench_validation(args.number)
+    print(f"get_positions_history validation: {per_call:.2f} us/call ({1e6 / per_call:,.0f} calls/s)")
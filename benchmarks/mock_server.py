@@ -0,0 +1,331 @@
+"""
+Local stand-in for the Topvisor /v2/json/get/... endpoints used by the benchmarks.
+
+Responses are synthetic but shaped like the real API: paginated project and
+competitor lists with "total", positions history documents covering the
+requested dates, summaries and cp1251 CSV region exports. Latency and error
+injection are configurable, so the same server can be used to measure both
+raw client overhead and behaviour under retries. Like the real API, bodies
+are compressed with br or gzip when the client accepts it.
+
+Usage: python benchmarks/mock_server.py [--port 8000] [--latency 0.05] [--error-rate 0.1] [--no-compression]
+
+When started as a script it prints "Mock Topvisor API at <url>" once it accepts connections.
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class MockConfig:
+    """
+    Data sizes and fault injection of the mock API. Attributes may be changed while the server runs.
+    """
+
+    def __init__(
+        self,
+        projects=2500,
+        competitors=40,
+        keywords=500,
+        regions=2000,
+        latency=0.0,
+        bandwidth=None,
+        error_rate=0.0,
+        error_code=503,
+        seed=1,
+        compression=True,
+    ):
+        """
+        :param projects: Number of projects returned by get/projects_2/projects.
+        :param competitors: Number of competitors per project.
+        :param keywords: Number of keywords in positions and snapshots history.
+        :param regions: Number of rows in the regions CSV export.
+        :param latency: Delay before every response, in seconds.
+        :param bandwidth: Response throughput limit in bytes per second (default: unlimited).
+        :param error_rate: Share of requests answered with an error (0..1).
+        :param error_code: Injected error: 429 and 503 are sent as HTTP statuses with Retry-After,
+            other codes as an "errors" list in a 200 response.
+        :param seed: Seed of the error injection.
+        :param compression: Compress bodies with br (if brotli is installed) or gzip
+            when the request's Accept-Encoding allows it.
+        """
+        self.projects = projects
+        self.competitors = competitors
+        self.keywords = keywords
+        self.regions = regions
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.random = random.Random(seed)
+        self.compression = compression
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.connections = 0
+
+    def should_fail(self):
+        with self.lock:
+            self.requests += 1
+            if self.error_rate and self.random.random() < self.error_rate:
+                self.errors += 1
+                return True
+        return False
+
+
+def _page(items, payload):
+    offset = payload.get("offset", 0)
+    limit = payload.get("limit")
+    page = items[offset:offset + limit] if limit is not None else items[offset:]
+    return {"result": page, "total": len(items)}
+
+
+def _dates(payload):
+    if payload.get("dates"):
+        return list(payload["dates"])
+    first = date.fromisoformat(payload.get("date1") or "2024-01-01")
+    last = date.fromisoformat(payload.get("date2") or payload.get("date1") or "2024-01-31")
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+def projects(config, payload):
+    items = [
+        {"id": i, "name": f"Project {i}", "site": f"https://site{i}.example", "date": "2024-01-01"}
+        for i in range(config.projects)
+    ]
+    return _page(items, payload)
+
+
+def competitors(config, payload):
+    project_id = payload.get("project_id") or 0
+    items = [
+        {"id": project_id * 1000 + i, "name": f"competitor{i}.example", "on": 1}
+        for i in range(config.competitors)
+    ]
+    return _page(items, payload)
+
+
+def positions_history(config, payload):
+    dates = _dates(payload)
+    regions = payload.get("regions_indexes") or [1]
+    keywords = [
+        {
+            "id": k,
+            "name": f"keyword {k}",
+            "positionsData": {
+                f"{day}:{payload.get('project_id', 1)}:{region}": {"position": (k * 7 + n) % 100 + 1}
+                for n, day in enumerate(dates)
+                for region in regions
+            },
+        }
+        for k in range(config.keywords)
+    ]
+    return {
+        "result": {
+            "headers": {"dates": dates, "projects": [{"id": payload.get("project_id", 1)}]},
+            "existsDates": dates,
+            "keywords": keywords,
+        }
+    }
+
+
+def snapshots_history(config, payload):
+    dates = _dates(payload)
+    keywords = [
+        {
+            "id": k,
+            "name": f"keyword {k}",
+            "snapshotsData": {
+                f"{day}:{payload.get('region_index', 1)}:{place}": {
+                    "url": f"https://site{place}.example/page{k}",
+                    "domain": f"site{place}.example",
+                }
+                for day in dates
+                for place in range(1, 11)
+            },
+        }
+        for k in range(config.keywords)
+    ]
+    return {"result": {"existsDates": dates, "keywords": keywords}}
+
+
+def summary(config, payload):
+    return {"result": {"tops": {"1_3": 12, "1_10": 48}, "avg": [17.5, 16.2], "visibility": [0.31, 0.34]}}
+
+
+def summary_chart(config, payload):
+    dates = _dates(payload)
+    return {"result": {"dates": dates, "seriesByProjectsId": {"1": {"avg": [10.0] * len(dates)}}}}
+
+
+def regions_export(config, payload):
+    lines = ["Ключ;Регион;Язык;Устройство;Глубина"]
+    for i in range(config.regions):
+        lines.append(f'{i};"Регион {i}; район";ru;{i % 3};100')
+    return ("\r\n".join(lines) + "\r\n").encode("cp1251")
+
+
+ROUTES = {
+    "/v2/json/get/projects_2/projects": projects,
+    "/v2/json/get/projects_2/competitors": competitors,
+    "/v2/json/get/positions_2/history": positions_history,
+    "/v2/json/get/positions_2/summary": summary,
+    "/v2/json/get/positions_2/summary/chart": summary_chart,
+    "/v2/json/get/positions_2/searchers/regions/export": regions_export,
+    "/v2/json/get/snapshots_2/history": snapshots_history,
+}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this small responses wait for delayed ACKs
+    disable_nagle_algorithm = True
+    config = MockConfig()
+
+    def setup(self):
+        super().setup()
+        with self.config.lock:
+            self.config.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        config = self.config
+        if config.latency:
+            time.sleep(config.latency)
+
+        route = ROUTES.get(self.path)
+        if route is None:
+            self._send(404, json.dumps({"errors": [{"code": 404, "string": "Not found"}]}).encode())
+            return
+        if config.should_fail():
+            error = {"code": config.error_code, "string": "Injected error"}
+            if config.error_code in (429, 503):
+                self._send(config.error_code, json.dumps({"errors": [error]}).encode(), {"Retry-After": "0"})
+            else:
+                self._send(200, json.dumps({"errors": [error]}).encode())
+            return
+
+        body = route(config, payload)
+        if isinstance(body, bytes):
+            self._send(200, body, content_type="text/csv; charset=windows-1251")
+        else:
+            self._send(200, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+
+    def _encode(self, body):
+        """
+        Returns the body and its Content-Encoding, compressed if the client accepts it.
+        """
+        if not self.config.compression:
+            return body, None
+        accepted = {value.split(";")[0].strip() for value in self.headers.get("Accept-Encoding", "").split(",")}
+        if "br" in accepted and brotli is not None:
+            return brotli.compress(body, quality=4), "br"
+        if "gzip" in accepted:
+            return gzip.compress(body, compresslevel=6), "gzip"
+        return body, None
+
+    def _send(self, status, body, headers=None, content_type="application/json"):
+        body, encoding = self._encode(body)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        bandwidth = self.config.bandwidth
+        if bandwidth:
+            chunk = max(1, bandwidth // 100)
+            for start in range(0, len(body), chunk):
+                self.wfile.write(body[start:start + chunk])
+                time.sleep(chunk / bandwidth)
+        else:
+            self.wfile.write(body)
+        with self.config.lock:
+            self.config.bytes_sent += len(body)
+
+
+class MockServer:
+    """
+    Runs the mock API in a background thread.
+
+    Example: with MockServer(MockConfig(latency=0.01)) as server: client.base_url = server.url
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        handler = type("ConfiguredMockHandler", (MockHandler,), {"config": config or MockConfig()})
+        self.config = handler.config
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (0: any free port)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay before every response, s")
+    parser.add_argument("--bandwidth", type=int, default=None, help="Response throughput limit, bytes/s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of failing requests")
+    parser.add_argument("--error-code", type=int, default=503)
+    parser.add_argument("--projects", type=int, default=2500)
+    parser.add_argument("--competitors", type=int, default=40)
+    parser.add_argument("--keywords", type=int, default=500)
+    parser.add_argument("--regions", type=int, default=2000)
+    parser.add_argument("--no-compression", dest="compression", action="store_false",
+                        help="Never compress response bodies")
+    args = parser.parse_args()
+    server = MockServer(
+        MockConfig(
+            projects=args.projects,
+            competitors=args.competitors,
+            keywords=args.keywords,
+            regions=args.regions,
+            latency=args.latency,
+            bandwidth=args.bandwidth,
+            error_rate=args.error_rate,
+            error_code=args.error_code,
+            compression=args.compression,
+        ),
+        port=args.port,
+    )
+    print(f"Mock Topvisor API at {server.url}", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
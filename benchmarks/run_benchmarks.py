@@ -0,0 +1,399 @@
+"""
+Benchmark suite for pytopvisor against a local mock of the Topvisor API.
+
+Starts benchmarks/mock_server.py in a separate process (so that the server
+does not compete with the client for the GIL) and measures, for every
+run_task operation, the per-call client overhead, requests/s, bytes/s and
+peak memory, plus fetch_all pages/s, concurrent run_tasks throughput, wire
+versus decoded bytes of compressed history pulls, behaviour under injected
+errors and offline parsing speed.
+
+Results are written to benchmarks/results/<label>.json; pass --compare with an
+earlier file to print the relative change of every metric.
+
+Usage: python benchmarks/run_benchmarks.py [--label NAME] [--quick] [--compare results/0.1.5.json]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+
+import _path  # noqa: F401
+
+from pytopvisor import Topvisor, configure_logging
+from pytopvisor.utils.cache import ResponseCache
+from pytopvisor.utils.metrics import MetricsCollector
+from pytopvisor.utils.retry import RetryPolicy
+
+from bench_payload import bench_payload
+from bench_validation import bench_validation
+from mock_server import MockConfig, positions_history, regions_export
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Arguments of every run_task operation
+OPERATIONS = {
+    "get_projects": {},
+    "get_competitors": {"project_id": 1},
+    "get_positions_history": {
+        "project_id": 1,
+        "regions_indexes": [1],
+        "date1": "2024-01-01",
+        "date2": "2024-01-31",
+    },
+    "get_positions_summary": {"project_id": 1, "region_index": 1, "dates": ["2024-01-01", "2024-01-31"]},
+    "get_positions_summary_chart": {
+        "project_id": 1,
+        "region_index": 1,
+        "date1": "2024-01-01",
+        "date2": "2024-01-31",
+    },
+    "get_searchers_regions": {"project_id": 1},
+    "get_snapshots_history": {"project_id": 1, "region_index": 1, "date1": "2024-01-01", "date2": "2024-01-07"},
+}
+
+
+class MockProcess:
+    """
+    Runs the mock API in a child process.
+    """
+
+    def __init__(self, **options):
+        command = [sys.executable, os.path.join(BENCHMARKS_DIR, "mock_server.py"), "--port", "0"]
+        for name, value in options.items():
+            command += [f"--{name.replace('_', '-')}", str(value)]
+        self.process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline()
+        match = re.search(r"(http://\S+)", line)
+        if match is None:
+            self.process.kill()
+            raise RuntimeError(f"Mock server did not start: {line!r}")
+        self.url = match.group(1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.process.terminate()
+        self.process.wait()
+
+
+def make_client(url, **options):
+    client = Topvisor("1", "benchmark", **options)
+    client.api_client.base_url = url
+    return client
+
+
+def detect_version():
+    try:
+        from importlib.metadata import version
+
+        return version("pytopvisor")
+    except Exception:
+        pass
+    setup_py = os.path.join(BENCHMARKS_DIR, os.pardir, "setup.py")
+    try:
+        with open(setup_py, encoding="utf-8") as f:
+            match = re.search(r'version="([^"]+)"', f.read())
+        return match.group(1) if match else "unknown"
+    except OSError:
+        return "unknown"
+
+
+def detect_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def peak_memory_mb(func):
+    """
+    Runs func once under tracemalloc and returns the peak traced memory in MB.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def consume(result):
+    """
+    Exhausts iterators returned by stream=True calls.
+    """
+    if hasattr(result, "__next__"):
+        for _ in result:
+            pass
+    return result
+
+
+def bench_operations(url, requests):
+    """
+    Per-operation overhead (cached, no network), throughput and peak memory.
+    """
+    results = {}
+    for operation, arguments in OPERATIONS.items():
+        # Overhead: validation, payload, dispatch and a cache hit, without HTTP
+        with make_client(url, cache=ResponseCache(ttl=3600)) as client:
+            client.run_task(operation, **arguments)
+            number = 2000
+            overhead = min(
+                timeit.repeat(lambda: client.run_task(operation, **arguments), number=number, repeat=3)
+            ) / number
+
+        metrics = MetricsCollector()
+        with make_client(url, hooks=[metrics]) as client:
+            client.run_task(operation, **arguments)
+            metrics.reset()
+            started = time.perf_counter()
+            for _ in range(requests):
+                client.run_task(operation, **arguments)
+            elapsed = time.perf_counter() - started
+            received = sum(m["response_bytes"] for m in metrics.snapshot()["endpoints"].values())
+            memory = peak_memory_mb(lambda: client.run_task(operation, **arguments))
+
+        results[operation] = {
+            "overhead_us": overhead * 1e6,
+            "requests_per_second": requests / elapsed,
+            "bytes_per_second": received / elapsed,
+            "mean_latency_ms": elapsed / requests * 1000,
+            "peak_memory_mb": memory,
+        }
+    return results
+
+
+def bench_fetch_all(url, workers=(1, 4, 8), limit=100):
+    """
+    fetch_all of get_projects split into pages, sequential and with read-ahead workers.
+    """
+    results = {}
+    for count in workers:
+        metrics = MetricsCollector()
+        with make_client(url, fetch_workers=count, hooks=[metrics]) as client:
+            started = time.perf_counter()
+            data = client.run_task("get_projects", fetch_all=True, limit=limit)
+            elapsed = time.perf_counter() - started
+        endpoint = next(iter(metrics.snapshot()["endpoints"].values()))
+        results[f"workers_{count}"] = {
+            "seconds": elapsed,
+            "pages_per_second": endpoint["requests"] / elapsed,
+            "records_per_second": len(data["result"]) / elapsed,
+            "bytes_per_second": endpoint["response_bytes"] / elapsed,
+        }
+    return results
+
+
+def bench_streaming(url):
+    """
+    Peak memory of full versus streamed responses.
+    """
+    history = OPERATIONS["get_positions_history"]
+    with make_client(url) as client:
+        return {
+            "fetch_all_projects_mb": peak_memory_mb(
+                lambda: client.run_task("get_projects", fetch_all=True, limit=100)
+            ),
+            "stream_projects_mb": peak_memory_mb(
+                lambda: consume(client.run_task("get_projects", stream=True, limit=100))
+            ),
+            "history_mb": peak_memory_mb(lambda: client.run_task("get_positions_history", **history)),
+            "stream_history_mb": peak_memory_mb(
+                lambda: consume(client.run_task("get_positions_history", stream=True, **history))
+            ),
+            "regions_mb": peak_memory_mb(lambda: client.run_task("get_searchers_regions", project_id=1)),
+            "stream_regions_mb": peak_memory_mb(
+                lambda: consume(client.run_task("get_searchers_regions", project_id=1, stream=True))
+            ),
+        }
+
+
+def bench_compression(url):
+    """
+    Wall time, wire and decoded bytes of history pulls with and without compression.
+    """
+    results = {}
+    for mode, compression in (("compressed", True), ("identity", False)):
+        metrics = MetricsCollector()
+        results[mode] = {}
+        with make_client(url, hooks=[metrics], compression=compression) as client:
+            for name, operation, stream in (
+                ("positions_history", "get_positions_history", False),
+                ("snapshots_history", "get_snapshots_history", False),
+                ("stream_snapshots_history", "get_snapshots_history", True),
+            ):
+                metrics.reset()
+                started = time.perf_counter()
+                consume(client.run_task(operation, stream=stream, **OPERATIONS[operation]))
+                elapsed = time.perf_counter() - started
+                endpoint = next(iter(metrics.snapshot()["endpoints"].values()))
+                results[mode][name] = {
+                    "seconds": elapsed,
+                    "wire_mb": endpoint["wire_bytes"] / 2 ** 20,
+                    "decoded_mb": endpoint["response_bytes"] / 2 ** 20,
+                }
+    return results
+
+
+def bench_concurrency(url, tasks=64, workers=(1, 8)):
+    """
+    run_tasks throughput over a latency-bound endpoint.
+    """
+    results = {}
+    specs = [{"task": "get_competitors", "project_id": i + 1} for i in range(tasks)]
+    for count in workers:
+        with make_client(url) as client:
+            started = time.perf_counter()
+            client.run_tasks(specs, max_workers=count)
+            elapsed = time.perf_counter() - started
+        results[f"workers_{count}"] = {"requests_per_second": tasks / elapsed}
+    return results
+
+
+def bench_errors(url, requests):
+    """
+    Throughput and outcome of sequential calls while the server fails part of the requests.
+    """
+    metrics = MetricsCollector()
+    failures = 0
+    policy = RetryPolicy(max_attempts=5, backoff_factor=0.001, max_backoff=0.01)
+    with make_client(url, hooks=[metrics], retry_policy=policy) as client:
+        started = time.perf_counter()
+        for i in range(requests):
+            try:
+                client.run_task("get_competitors", project_id=i + 1)
+            except Exception:
+                failures += 1
+        elapsed = time.perf_counter() - started
+    endpoint = next(iter(metrics.snapshot()["endpoints"].values()))
+    return {
+        "requests_per_second": requests / elapsed,
+        "retries": endpoint["retries"],
+        "failures": failures,
+    }
+
+
+def bench_parsing(number=5):
+    """
+    Offline parsing speed of CSV exports and history documents, in MB/s.
+    """
+    from pytopvisor.services.api import TopvisorAPI
+    from pytopvisor.utils.json_codec import get_json_codec
+    from pytopvisor.utils.json_stream import JsonRecordStreamParser
+
+    config = MockConfig(regions=50000, keywords=2000)
+    csv_body = regions_export(config, {})
+    history_body = json.dumps(
+        positions_history(config, {"date1": "2024-01-01", "date2": "2024-01-31"}), ensure_ascii=False
+    ).encode("utf-8")
+    codec = get_json_codec("auto")
+
+    def stream_history():
+        parser = JsonRecordStreamParser(("result", "keywords"))
+        for start in range(0, len(history_body), 65536):
+            parser.feed(history_body[start:start + 65536])
+        parser.close()
+
+    def megabytes_per_second(func, size):
+        return size / min(timeit.repeat(func, number=1, repeat=number)) / 2 ** 20
+
+    return {
+        "csv_mb_per_second": megabytes_per_second(
+            lambda: TopvisorAPI.parse_text_content(csv_body), len(csv_body)
+        ),
+        "json_mb_per_second": megabytes_per_second(lambda: codec.loads(history_body), len(history_body)),
+        "json_stream_mb_per_second": megabytes_per_second(stream_history, len(history_body)),
+        "json_codec": codec.name,
+    }
+
+
+def flatten(results, prefix=""):
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten(value, f"{name}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+def compare(previous, current):
+    """
+    Prints every numeric metric of two result files side by side.
+    """
+    old = dict(flatten(previous["results"]))
+    print(f"\n{'metric':<60} {previous['label']:>14} {current['label']:>14} {'change':>9}")
+    for name, value in flatten(current["results"]):
+        if name not in old:
+            continue
+        change = f"{(value / old[name] - 1) * 100:+.1f}%" if old[name] else "n/a"
+        print(f"{name:<60} {old[name]:>14.3f} {value:>14.3f} {change:>9}")
+
+
+def run(quick=False):
+    requests = 10 if quick else 50
+    results = {}
+    with MockProcess(projects=2500) as server:
+        results["operations"] = bench_operations(server.url, requests)
+        results["streaming"] = bench_streaming(server.url)
+    with MockProcess(latency=0.02) as server:
+        results["fetch_all"] = bench_fetch_all(server.url)
+        results["concurrency"] = bench_concurrency(server.url, tasks=16 if quick else 64)
+    # About 80 Mbit/s, so that the transfer of large bodies dominates as it does over the internet
+    with MockProcess(bandwidth=10_000_000) as server:
+        results["compression"] = bench_compression(server.url)
+    with MockProcess(error_rate=0.2) as server:
+        results["errors"] = bench_errors(server.url, requests)
+    results["parsing"] = bench_parsing(2 if quick else 5)
+    number = 10000 if quick else 100000
+    results["validation_us"] = bench_validation(number)
+    results["payload_us"], results["payload_template_us"] = bench_payload(number)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--label", default=None, help="Result name (default: package version)")
+    parser.add_argument("--output-dir", default=os.path.join(BENCHMARKS_DIR, "results"))
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations, for a smoke run")
+    parser.add_argument("--compare", default=None, help="Earlier result file to compare with")
+    args = parser.parse_args()
+    # Injected errors would otherwise flood the console with retry warnings
+    configure_logging(handlers=[logging.NullHandler()])
+
+    version = detect_version()
+    report = {
+        "label": args.label or version,
+        "version": version,
+        "commit": detect_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "quick": args.quick,
+        "results": run(args.quick),
+    }
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    path = os.path.join(args.output_dir, f"{report['label']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report["results"], indent=2))
+    print(f"Saved to {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
@@ -1,3 +1,23 @@
-from .topvisor import Topvisor
+__all__ = ["Topvisor", "AsyncTopvisor", "configure_logging"]
 
-__all__ = ["Topvisor"]
\ No newline at end of file
+# Clients are imported on first access so that importing the package stays cheap
+_LAZY_IMPORTS = {
+    "Topvisor": ".topvisor",
+    "AsyncTopvisor": ".async_topvisor",
+    "configure_logging": ".utils.logger",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,110 @@
+import asyncio
+from pytopvisor.topvisor import Topvisor
+from pytopvisor.utils.tasks import TaskResult, expand_grid, normalize_task_spec
+
+
+class AsyncTopvisor(Topvisor):
+    """
+    Asynchronous Topvisor client.
+
+    Uses the same services, PayloadFactory and Validator as Topvisor,
+    but every operation is awaitable and requests share one event loop.
+    """
+
+    api_class = "pytopvisor.services.async_api:AsyncTopvisorAPI"
+
+    async def close(self):
+        """
+        Closes the underlying API client and its connection pool.
+        """
+        await self.api_client.close()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncTopvisor")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def run_task(self, task_name, fetch_all=False, limit=10000, stream=False, **kwargs):
+        """
+        Universal method for executing operations asynchronously.
+        :param task_name: Operation name.
+        :param fetch_all: If True, fetch all paginated data (default: False).
+        :param limit: Number of items per request if fetch_all=True or stream=True (default: 10000).
+        :param stream: If True, return an async iterator over records, as stream_task does (default: False).
+        :param kwargs: Arguments for the operation.
+        :return: Operation execution result (single response, all paginated data
+            or an async iterator of records).
+        """
+        if stream:
+            return self.stream_task(task_name, limit=limit, **kwargs)
+        method = self.get_operation(task_name)
+        kwargs["fetch_all"] = fetch_all
+        kwargs["limit"] = limit
+        return await method(**kwargs)
+
+    def stream_task(self, task_name, limit=10000, **kwargs):
+        """
+        Executes a paginated operation as an async iterator over its records.
+        :param task_name: Operation name.
+        :param limit: Number of items per request (default: 10000).
+        :param kwargs: Arguments for the operation.
+        :return: Async generator of result records.
+        """
+        method = self.get_operation(task_name)
+        kwargs["limit"] = limit
+        kwargs["stream"] = True
+        return method(**kwargs)
+
+    async def _run_spec(self, spec, semaphore):
+        kwargs = dict(spec)
+        task_name = kwargs.pop("task")
+        async with semaphore:
+            try:
+                return TaskResult(spec, await self.run_task(task_name, **kwargs), None)
+            except Exception as e:
+                return TaskResult(spec, None, e)
+
+    async def run_tasks(self, specs, max_workers=8):
+        """
+        Runs many operations concurrently.
+        :param specs: Iterable of task specs: {"task": operation name, **operation arguments}.
+        :param max_workers: Maximum number of operations running at once (default: 8).
+        :return: List of TaskResult(spec, result, error) in spec order.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        specs = [normalize_task_spec(spec) for spec in specs]
+        return list(await asyncio.gather(*(self._run_spec(spec, semaphore) for spec in specs)))
+
+    async def iter_tasks(self, specs, max_workers=8):
+        """
+        Runs many operations concurrently and yields results as they complete.
+        :param specs: Iterable of task specs: {"task": operation name, **operation arguments}.
+        :param max_workers: Maximum number of operations running at once (default: 8).
+        :return: Async generator of TaskResult in completion order.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        tasks = [
+            asyncio.ensure_future(self._run_spec(normalize_task_spec(spec), semaphore))
+            for spec in specs
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def map_task(self, task_name, grid, max_workers=8, **kwargs):
+        """
+        Runs one operation for every combination of the grid values.
+        :param task_name: Operation name.
+        :param grid: Mapping of argument name to values, e.g. {"project_id": [1, 2], "region_index": [1, 2]}.
+        :param max_workers: Maximum number of operations running at once (default: 8).
+        :param kwargs: Arguments shared by all runs.
+        :return: List of TaskResult(spec, result, error) in spec order.
+        """
+        return await self.run_tasks(expand_grid(task_name, grid, **kwargs), max_workers=max_workers)
@@ -1,59 +1,456 @@
+import hashlib
+import logging
+import time
 import requests
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from pytopvisor.utils.logger import logger
+from pytopvisor.utils.rate_limiter import RateLimiter
+from pytopvisor.utils.retry import RetryPolicy
+from pytopvisor.utils.cache import make_cache_key
+from pytopvisor.utils.singleflight import SingleFlight
+from pytopvisor.utils.json_codec import get_json_codec
+from pytopvisor.utils.csv_stream import CsvStreamParser, iter_csv_rows
+from pytopvisor.utils.json_stream import JsonRecordStreamParser
+from pytopvisor.utils.metrics import RequestEvent, track_chunks, wire_bytes
+from pytopvisor.services.transport import HttpxTransport, RequestsTransport, accept_encoding
 from pytopvisor.utils.exceptions import (
     TopvisorAPIError,
+    ServerError,
+    CircuitOpenError,
     ERROR_MAPPING
 )
 
 
 class TopvisorAPI:
-    def __init__(self, user_id, api_key):
+    # Transport exceptions that the retry policy treats as transient
+    transport_errors = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    single_flight_class = SingleFlight
+
+    def __init__(
+        self,
+        user_id,
+        api_key,
+        pool_connections=10,
+        pool_maxsize=10,
+        keep_alive=True,
+        fetch_workers=4,
+        rate_limit=None,
+        rate_burst=None,
+        retry_policy=None,
+        timeout=(10, 120),
+        circuit_breaker=None,
+        cache=None,
+        coalesce=False,
+        json_codec="auto",
+        hooks=None,
+        transport=None,
+        pool_block=False,
+        http2=False,
+        compression=True,
+    ):
+        """
+        :param user_id: Topvisor user ID.
+        :param api_key: Topvisor API key.
+        :param pool_connections: Number of connection pools to cache (default: 10).
+        :param pool_maxsize: Maximum number of connections kept per pool (default: 10).
+        :param keep_alive: Reuse connections between requests (default: True).
+        :param fetch_workers: Number of pages fetch_all requests concurrently (default: 4).
+        :param rate_limit: Maximum requests per second, or a shared RateLimiter (default: no limit).
+        :param rate_burst: Number of requests allowed back to back (default: rate_limit).
+        :param retry_policy: RetryPolicy for transient errors (default: RetryPolicy()).
+        :param timeout: (connect, read) timeout in seconds for every request (default: (10, 120)).
+        :param circuit_breaker: CircuitBreaker that fails fast while the API is degraded (default: none).
+        :param cache: ResponseCache serving repeated requests without a round-trip (default: none).
+        :param coalesce: Share one HTTP request between concurrent identical calls (default: False).
+        :param json_codec: JSONCodec or its name: "json", "orjson" or "auto" (default: "auto").
+        :param hooks: Callables receiving a RequestEvent after every request, e.g. MetricsCollector.
+        :param transport: Transport sending the HTTP requests, e.g. RecordingTransport or
+            ReplayTransport (default: RequestsTransport with the pool settings above).
+        :param pool_block: Wait for a free pooled connection instead of opening a throwaway one
+            when more than pool_maxsize requests run at once (default: False).
+        :param http2: Multiplex requests over HTTP/2 connections via HttpxTransport, falling back
+            to HTTP/1.1 where unsupported (requires pip install pytopvisor[http2], default: False).
+        :param compression: Ask for gzip/deflate (and br if brotli is installed) compressed responses;
+            bodies are decompressed while they are read (default: True).
+        """
+        self.hooks = list(hooks or ())
+        self.fetch_workers = fetch_workers
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self.cache = cache
+        # Keeps the responses of different accounts apart in a shared cache without storing the key
+        self.cache_scope = hashlib.sha256(f"{user_id}:{api_key}".encode()).hexdigest()[:32]
+        self.single_flight = self.single_flight_class() if coalesce else None
+        self.json_codec = get_json_codec(json_codec)
+        if rate_limit is None or isinstance(rate_limit, RateLimiter):
+            self.rate_limiter = rate_limit
+        else:
+            self.rate_limiter = RateLimiter(rate_limit, rate_burst)
         self.base_url = "https://api.topvisor.com"
         self.headers = {
             "Content-type": "application/json",
             "User-Id": user_id,
             "Authorization": f"bearer {api_key}",
+            "Accept-Encoding": accept_encoding() if compression else "identity",
         }
+        # Connection-specific headers are not allowed in HTTP/2; the pool limits handle keep-alive there
+        if not keep_alive and not http2:
+            self.headers["Connection"] = "close"
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        self.pool_block = pool_block
+        self.transport = self._create_transport(pool_connections, pool_maxsize, transport)
+
+    def _create_transport(self, pool_connections, pool_maxsize, transport=None):
+        """
+        Returns the given transport, a pooled keep-alive RequestsTransport,
+        or an HttpxTransport when HTTP/2 is enabled.
+        """
+        if transport is not None:
+            return transport
+        if self.http2:
+            return HttpxTransport(http2=True, pool_maxsize=pool_maxsize, keep_alive=self.keep_alive)
+        return RequestsTransport(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=self.pool_block
+        )
+
+    def close(self):
+        """
+        Closes the transport and releases all pooled connections.
+        """
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_hook(self, hook):
+        """
+        Registers a callable receiving a RequestEvent after every request.
+        """
+        # Copy on write, so requests running in other threads iterate a stable list
+        self.hooks = self.hooks + [hook]
+
+    def remove_hook(self, hook):
+        hooks = list(self.hooks)
+        hooks.remove(hook)
+        self.hooks = hooks
 
-    def send_request(self, endpoint, payload):
+    def _start_event(self, endpoint, payload):
+        return RequestEvent(endpoint, payload) if self.hooks else None
+
+    def _emit(self, event, error=None):
+        """
+        Completes the event and passes it to the hooks. Hook failures are logged, not raised.
+        """
+        if event is None:
+            return
+        event.finish(error)
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Request hook %r failed", hook)
+
+    def _post(self, url, payload, timeout=None, stream=False, event=None):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        data = self.json_codec.dumps(payload)
+        started = time.perf_counter()
+        response = self.transport.post(
+            url,
+            headers=self.headers,
+            data=data,
+            timeout=timeout or self.timeout,
+            stream=stream,
+        )
+        if event is not None:
+            event.payload_bytes = len(data)
+            event.status_code = response.status_code
+            event.time_to_headers = response.elapsed.total_seconds()
+            if not stream:
+                # Without stream the body has already been read by the transport
+                event.transfer_time = max(0.0, time.perf_counter() - started - event.time_to_headers)
+                event.response_bytes = len(response.content)
+                event.wire_bytes = wire_bytes(response, event.response_bytes)
+        return response
+
+    def _with_retries(self, func, endpoint, payload, timeout=None, event=None):
+        """
+        Calls func(endpoint, payload, timeout, event), retrying transient failures per retry_policy.
+
+        An event passed in by the caller is only updated; the caller emits it
+        (used by streaming methods that finish reading the body later).
+        """
+        owns_event = event is None
+        if owns_event:
+            event = self._start_event(endpoint, payload)
+        attempt = 1
+        while True:
+            if self.circuit_breaker is not None:
+                try:
+                    self.circuit_breaker.before_request()
+                except CircuitOpenError as e:
+                    if owns_event:
+                        self._emit(event, e)
+                    raise
+            try:
+                result = func(endpoint, payload, timeout, event)
+            except Exception as e:
+                self._record_outcome(e)
+                if not self.retry_policy.should_retry(e, attempt, self.transport_errors):
+                    if owns_event:
+                        self._emit(event, e)
+                    raise
+                time.sleep(self._get_retry_delay(endpoint, e, attempt))
+                attempt += 1
+                if event is not None:
+                    event.retries += 1
+            except BaseException:
+                # Cancelled or interrupted: no outcome, but a half-open trial must not stay taken
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.release()
+                raise
+            else:
+                self._record_outcome(None)
+                if owns_event:
+                    self._emit(event)
+                return result
+
+    def _get_retry_delay(self, endpoint, error, attempt):
+        """
+        Logs an upcoming retry and returns the delay before it.
+        """
+        delay = self.retry_policy.get_delay(attempt, getattr(error, "retry_after", None))
+        logger.warning(
+            "Retrying %s in %.2fs (attempt %d/%d) after error: %s",
+            endpoint, delay, attempt + 1, self.retry_policy.max_attempts, error,
+        )
+        return delay
+
+    def _record_outcome(self, error):
+        """
+        Reports the result of a request attempt to the circuit breaker.
+        Only server errors and transport failures count against the circuit.
+        """
+        if self.circuit_breaker is None:
+            return
+        if error is not None and isinstance(error, (ServerError,) + self.transport_errors):
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _raise_for_status(self, url, response):
+        """
+        Raises the mapped API exception for HTTP statuses listed in ERROR_MAPPING
+        (e.g. 429, 503) and ServerError for any other 5xx status (e.g. 502 from a gateway),
+        otherwise falls back to the transport's raise_for_status.
+        """
+        status = response.status_code
+        if status in ERROR_MAPPING or 500 <= status < 600:
+            retry_after = RetryPolicy.parse_retry_after(response.headers.get("Retry-After"))
+            error = {"code": status, "string": f"HTTP {status}"}
+            self._handle_api_errors(url, [error], retry_after=retry_after, default=ServerError)
+        response.raise_for_status()
+
+    def _cached(self, func, endpoint, payload, timeout=None):
+        """
+        Calls func through _with_retries, looking the response up in the cache first and storing it there
+        afterwards; concurrent identical calls share one call when coalescing is enabled.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, payload, self.cache_scope)
+            if cached is not None:
+                return cached
+        if self.single_flight is not None:
+            result = self.single_flight.do(
+                make_cache_key(endpoint, payload),
+                self._with_retries,
+                func,
+                endpoint,
+                payload,
+                timeout,
+            )
+        else:
+            result = self._with_retries(func, endpoint, payload, timeout)
+        if self.cache is not None:
+            self.cache.set(endpoint, payload, result, self.cache_scope)
+        return result
+
+    def send_request(self, endpoint, payload, timeout=None):
+        """
+        Sends a JSON request, retrying transient failures according to retry_policy.
+        Served from the cache when one is configured; concurrent identical
+        calls share one request when coalescing is enabled.
+        """
+        return self._cached(self._send_request, endpoint, payload, timeout)
+
+    def send_text_request(self, endpoint, payload, timeout=None):
+        """
+        Sends a request returning CSV text, retrying transient failures according to retry_policy.
+        Served from the cache when one is configured; concurrent identical
+        calls share one request when coalescing is enabled.
+        """
+        return self._cached(self._send_text_request, endpoint, payload, timeout)
+
+    def _send_request(self, endpoint, payload, timeout=None, event=None):
 
         try:
             url = f"{self.base_url}{endpoint}"
             payload = payload or {}
-            response = requests.post(url, headers=self.headers, json=payload)
-            response.raise_for_status()
+            response = self._post(url, payload, timeout, event=event)
+            self._raise_for_status(url, response)
 
             # Logging a successful request
-            logger.debug(f"API request completed successfully: {url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API request completed successfully: %s", url)
 
             # Attempt to parse the response as JSON
+            parse_started = time.perf_counter()
             try:
-                data = response.json()
+                data = self.json_codec.loads(response.content)
             except ValueError as e:
-                logger.error(f"JSON parsing error: {e}. Response: {response.text}")
+                logger.error("JSON parsing error: %s. Response: %s", e, response.text)
                 raise RuntimeError("Response from API is not valid JSON.")
+            if event is not None:
+                event.parse_time = time.perf_counter() - parse_started
 
             # Check for errors in the response
             if "errors" in data and data["errors"]:
-                self._handle_api_errors(url, data["errors"])
+                retry_after = RetryPolicy.parse_retry_after(response.headers.get("Retry-After"))
+                self._handle_api_errors(url, data["errors"], retry_after=retry_after)
 
             return data
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error during API request: {e}")
+            logger.error("Error during API request: %s", e)
             raise
 
-    def send_text_request(self, endpoint, payload):
+    def _send_text_request(self, endpoint, payload, timeout=None, event=None):
         try:
             url = f"{self.base_url}{endpoint}"
-            response = requests.post(url, headers=self.headers, json=payload)
-            response.raise_for_status()
-            logger.debug(f"API request completed successfully: {url}")
-            return self.parse_text_response(response.text)
+            response = self._post(url, payload, timeout, event=event)
+            self._raise_for_status(url, response)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API request completed successfully: %s", url)
+            parse_started = time.perf_counter()
+            rows = self.parse_text_content(response.content)
+            if event is not None:
+                event.parse_time = time.perf_counter() - parse_started
+            return rows
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error during API request: {e}")
+            logger.error("Error during API request: %s", e)
+            raise
+
+    def _open_stream(self, endpoint, payload, timeout=None, event=None):
+        url = f"{self.base_url}{endpoint}"
+        response = self._post(url, payload, timeout, stream=True, event=event)
+        try:
+            self._raise_for_status(url, response)
+        except Exception:
+            response.close()
             raise
+        return response
+
+    def iter_text_rows(self, endpoint, payload, delimiter=";", typed=False, chunk_size=65536, timeout=None):
+        """
+        Streams a CSV export row by row without loading the whole body.
+
+        Only establishing the response is retried; errors while reading the body are raised.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param delimiter: Delimiter used in the text (default ';').
+        :param typed: If True, treat the first row as a header and yield namedtuples.
+        :param chunk_size: Number of bytes read at a time (default: 65536).
+        :param timeout: (connect, read) timeout (default: client timeout).
+        :return: Generator of rows.
+        """
+        event = self._start_event(endpoint, payload)
+        error = None
+        try:
+            response = self._with_retries(self._open_stream, endpoint, payload, timeout, event)
+            try:
+                yield from iter_csv_rows(
+                    track_chunks(response.iter_content(chunk_size=chunk_size), event, response),
+                    delimiter=delimiter,
+                    typed=typed,
+                )
+            except requests.exceptions.RequestException as e:
+                logger.error("Error during API request: %s", e)
+                raise
+            finally:
+                response.close()
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._emit(event, error)
+
+    def iter_json_records(self, endpoint, payload, path=("result", "keywords"), chunk_size=65536, timeout=None):
+        """
+        Streams the items of one array of a JSON response while the body is downloaded.
+
+        Peak memory is about one item instead of the whole response. API errors
+        are checked once the body has been read completely.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param path: Keys leading to the array (default: result.keywords).
+        :param chunk_size: Number of bytes read at a time (default: 65536).
+        :param timeout: (connect, read) timeout (default: client timeout).
+        :return: Generator of array items.
+        """
+        url = f"{self.base_url}{endpoint}"
+        event = self._start_event(endpoint, payload)
+        error = None
+        attempt = 1
+        try:
+            while True:
+                if event is not None:
+                    event.start_attempt()
+                response = self._with_retries(self._open_stream, endpoint, payload or {}, timeout, event)
+                parser = JsonRecordStreamParser(path)
+                yielded = False
+                try:
+                    for chunk in track_chunks(response.iter_content(chunk_size=chunk_size), event, response):
+                        for record in parser.feed(chunk):
+                            yielded = True
+                            yield record
+                    records = parser.close()
+                except requests.exceptions.RequestException as e:
+                    logger.error("Error during API request: %s", e)
+                    raise
+                except ValueError as e:
+                    logger.error("JSON parsing error: %s", e)
+                    raise RuntimeError("Response from API is not valid JSON.")
+                finally:
+                    response.close()
+
+                envelope = parser.envelope or {}
+                if envelope.get("errors"):
+                    try:
+                        self._handle_api_errors(url, envelope["errors"])
+                    except TopvisorAPIError as e:
+                        # Retrying is only safe if nothing has been yielded yet
+                        if yielded or not self.retry_policy.should_retry(e, attempt):
+                            raise
+                        time.sleep(self._get_retry_delay(endpoint, e, attempt))
+                        attempt += 1
+                        if event is not None:
+                            event.retries += 1
+                        continue
+                yield from records
+                return
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._emit(event, error)
 
     def parse_text_response(self, text, delimiter=";"):
         """
@@ -62,20 +459,26 @@ class TopvisorAPI:
         :param delimiter: Delimiter used in the text (default ';').
         :return: A list of lists containing the data.
         """
+        return self.parse_text_content(text.encode("raw_unicode_escape"), delimiter)
 
-        decoded_text = text.encode("raw_unicode_escape").decode("cp1251")
-        lines = decoded_text.strip().split("\n")
-        result = []
-
-        for line in lines:
-            values = line.split(delimiter)
-            result.append(values)
-
-        return result
+    @staticmethod
+    def parse_text_content(content, delimiter=";"):
+        """
+        Parses a raw cp1251 CSV response body.
+        :param content: Response body bytes.
+        :param delimiter: Delimiter used in the text (default ';').
+        :return: A list of lists containing the data.
+        """
+        parser = CsvStreamParser(delimiter=delimiter)
+        return parser.feed(content) + parser.close()
 
-    def _handle_api_errors(self, url, errors):
+    def _handle_api_errors(self, url, errors, retry_after=None, default=TopvisorAPIError):
         """
         Handles API errors and raises appropriate exceptions.
+        :param url: Requested URL.
+        :param errors: List of errors from the API response.
+        :param retry_after: Delay suggested by the server, attached to the exception.
+        :param default: Exception class for codes missing from ERROR_MAPPING.
         """
         for error in errors:
             code = error.get("code")
@@ -83,41 +486,140 @@ class TopvisorAPI:
             detail = error.get("detail", "")
 
             if code in (429,):  # Rate limit
-                logger.warning(f"API Warning [{code}]: {message}. Details: {detail}. URL: {url}")
+                logger.warning("API Warning [%s]: %s. Details: %s. URL: %s", code, message, detail, url)
             elif code in (503,):  # Server error
-                logger.critical(f"API Critical [{code}]: {message}. Details: {detail}. URL: {url}")
+                logger.critical("API Critical [%s]: %s. Details: %s. URL: %s", code, message, detail, url)
             else:
-                logger.error(f"API Error [{code}]: {message}. Details: {detail}. URL: {url}")
+                logger.error("API Error [%s]: %s. Details: %s. URL: %s", code, message, detail, url)
+
+            exception_class = ERROR_MAPPING.get(code, default)
+            exception = exception_class(f"[{code}] {message}. {detail}")
+            exception.retry_after = retry_after
+            raise exception
 
-            exception_class = ERROR_MAPPING.get(code, TopvisorAPIError)
-            raise exception_class(f"[{code}] {message}. {detail}")
+    @staticmethod
+    def _check_page(data):
+        if "result" not in data or not isinstance(data["result"], list):
+            raise TopvisorAPIError("Unexpected API response format")
+        return data
 
-    def fetch_all(self, endpoint, payload, limit=10000):
+    @staticmethod
+    def _remaining_payloads(payload, limit, total):
         """
-        Fetches all data from an endpoint with pagination.
+        Builds payloads for every page after the first one.
+        :param payload: First page payload (with limit and offset set).
+        :param limit: Number of items per page.
+        :param total: Total number of items reported by the first page.
+        :return: List of payloads in offset order.
+        """
+        return [
+            {**payload, "offset": offset}
+            for offset in range(payload["offset"] + limit, total, limit)
+        ]
+
+    def send_many(self, endpoint, payloads, combine=None, timeout=None):
+        """
+        Sends several requests to one endpoint concurrently.
+        :param endpoint: API endpoint.
+        :param payloads: List of request payloads.
+        :param combine: Function merging the list of responses into one result (optional).
+        :param timeout: (connect, read) timeout for every request (default: client timeout).
+        :return: List of responses in payload order, or the value returned by combine.
+        """
+        payloads = list(payloads)
+        workers = max(1, min(self.fetch_workers, len(payloads)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(
+                executor.map(lambda payload: self.send_request(endpoint, payload, timeout), payloads)
+            )
+        return combine(responses) if combine else responses
+
+    def iter_pages(self, endpoint, payload, limit=10000, workers=None, timeout=None):
+        """
+        Iterates over paginated responses one page at a time.
+
+        Pages are yielded in offset order. Once the first page reports "total",
+        up to `workers` following pages are requested ahead, so memory stays
+        bounded by a few pages regardless of the total size.
         :param endpoint: API endpoint.
         :param payload: Request payload.
         :param limit: Number of items per request (default: 10000).
-        :return: List of all results.
+        :param workers: Number of concurrent page requests (default: fetch_workers).
+        :param timeout: (connect, read) timeout for every page request (default: client timeout).
+        :return: Generator of page responses.
         """
-        result = []
+        workers = max(1, workers or self.fetch_workers)
         payload = payload.copy()
         payload["limit"] = limit
         payload["offset"] = 0
-        total = None
 
-        while True:
-            data = self.send_request(endpoint, payload)
-            if "result" not in data or not isinstance(data["result"], list):
-                raise TopvisorAPIError("Unexpected API response format")
+        data = self._check_page(self.send_request(endpoint, payload, timeout))
+        fetched = len(data["result"])
+        total = data.get("total")
+        yield data
 
-            result.extend(data["result"])
-            total = data.get("total", total)
+        if len(data["result"]) < limit or (total is not None and fetched >= total):
+            return
+
+        if total is None:
+            # Without a total the pages can only be walked one by one
+            while True:
+                payload["offset"] += limit
+                data = self._check_page(self.send_request(endpoint, payload, timeout))
+                fetched += len(data["result"])
+                total = data.get("total", total)
+                yield data
+                if total is not None and fetched >= total:
+                    return
+                if len(data["result"]) < limit:
+                    return
+
+        payloads = iter(self._remaining_payloads(payload, limit, total))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(
+                executor.submit(self.send_request, endpoint, page, timeout)
+                for page in islice(payloads, workers)
+            )
+            try:
+                while pending:
+                    data = self._check_page(pending.popleft().result())
+                    page = next(payloads, None)
+                    if page is not None:
+                        pending.append(executor.submit(self.send_request, endpoint, page, timeout))
+                    yield data
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_results(self, endpoint, payload, limit=10000, workers=None, timeout=None):
+        """
+        Iterates over the records of all pages.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param limit: Number of items per request (default: 10000).
+        :param workers: Number of concurrent page requests (default: fetch_workers).
+        :param timeout: (connect, read) timeout for every page request (default: client timeout).
+        :return: Generator of result records.
+        """
+        for data in self.iter_pages(endpoint, payload, limit=limit, workers=workers, timeout=timeout):
+            yield from data["result"]
 
-            if total is not None and len(result) >= total:
-                break
-            if len(data["result"]) < limit:
-                break
+    def fetch_all(self, endpoint, payload, limit=10000, workers=None, timeout=None):
+        """
+        Fetches all data from an endpoint with pagination.
 
-            payload["offset"] += limit
-        return {"result": result, "total": total}
\ No newline at end of file
+        The first page is requested alone. If it reports "total", the remaining
+        pages are requested concurrently and merged back in offset order.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param limit: Number of items per request (default: 10000).
+        :param workers: Number of concurrent page requests (default: fetch_workers).
+        :param timeout: (connect, read) timeout for every page request (default: client timeout).
+        :return: List of all results.
+        """
+        result = []
+        total = None
+        for data in self.iter_pages(endpoint, payload, limit=limit, workers=workers, timeout=timeout):
+            result.extend(data["result"])
+            total = data.get("total", total)
+        return {"result": result, "total": total}
@@ -0,0 +1,521 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from itertools import islice
+from pytopvisor.services.api import TopvisorAPI
+from pytopvisor.utils.logger import logger
+from pytopvisor.utils.retry import RetryPolicy
+from pytopvisor.utils.exceptions import CircuitOpenError, TopvisorAPIError
+from pytopvisor.utils.csv_stream import CsvStreamParser
+from pytopvisor.utils.json_stream import JsonRecordStreamParser
+from pytopvisor.utils.metrics import atrack_chunks, wire_bytes
+from pytopvisor.utils.cache import make_cache_key
+from pytopvisor.utils.singleflight import AsyncSingleFlight
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncTopvisorAPI(TopvisorAPI):
+    """
+    Asynchronous counterpart of TopvisorAPI built on httpx.AsyncClient.
+
+    Services created by ServiceFactory work with this client unchanged:
+    their methods return awaitables instead of results.
+    """
+
+    transport_errors = (httpx.TransportError,) if httpx is not None else ()
+    single_flight_class = AsyncSingleFlight
+
+    def __init__(
+        self,
+        user_id,
+        api_key,
+        max_concurrency=10,
+        pool_connections=10,
+        pool_maxsize=10,
+        keep_alive=True,
+        fetch_workers=4,
+        rate_limit=None,
+        rate_burst=None,
+        retry_policy=None,
+        timeout=(10, 120),
+        circuit_breaker=None,
+        cache=None,
+        coalesce=False,
+        json_codec="auto",
+        hooks=None,
+        transport=None,
+        http2=False,
+        compression=True,
+    ):
+        """
+        :param user_id: Topvisor user ID.
+        :param api_key: Topvisor API key.
+        :param max_concurrency: Maximum number of in-flight requests per client (default: 10).
+        :param pool_connections: Kept for signature compatibility with TopvisorAPI.
+        :param pool_maxsize: Maximum number of pooled connections (default: 10).
+        :param keep_alive: Reuse connections between requests (default: True).
+        :param fetch_workers: Number of pages fetch_all requests concurrently (default: 4).
+        :param rate_limit: Maximum requests per second, or a shared RateLimiter (default: no limit).
+        :param rate_burst: Number of requests allowed back to back (default: rate_limit).
+        :param retry_policy: RetryPolicy for transient errors (default: RetryPolicy()).
+        :param timeout: (connect, read) timeout in seconds for every request (default: (10, 120)).
+        :param circuit_breaker: CircuitBreaker that fails fast while the API is degraded (default: none).
+        :param cache: ResponseCache serving repeated requests without a round-trip (default: none).
+        :param coalesce: Share one HTTP request between concurrent identical calls (default: False).
+        :param json_codec: JSONCodec or its name: "json", "orjson" or "auto" (default: "auto").
+        :param hooks: Callables receiving a RequestEvent after every request, e.g. MetricsCollector.
+        :param transport: httpx.AsyncBaseTransport used by the client, e.g. httpx.MockTransport
+            (default: httpx connection pool with the settings above). Cassette transports
+            (RecordingTransport, ReplayTransport) are sync only and raise TypeError here.
+        :param http2: Multiplex requests over HTTP/2 connections, falling back to HTTP/1.1
+            where unsupported (requires pip install pytopvisor[http2], default: False).
+        :param compression: Ask for gzip/deflate (and br if brotli is installed) compressed responses;
+            bodies are decompressed while they are read (default: True).
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncTopvisorAPI requires httpx. Install it with: pip install pytopvisor[async]"
+            )
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        super().__init__(
+            user_id,
+            api_key,
+            pool_connections,
+            pool_maxsize,
+            keep_alive,
+            fetch_workers,
+            rate_limit,
+            rate_burst,
+            retry_policy,
+            timeout,
+            circuit_breaker,
+            cache,
+            coalesce,
+            json_codec,
+            hooks,
+            transport,
+            http2=http2,
+            compression=compression,
+        )
+
+    def _create_transport(self, pool_connections, pool_maxsize, transport=None):
+        """
+        Creates an async HTTP client with a pooled keep-alive transport, negotiating HTTP/2 if enabled.
+        """
+        if transport is not None and not isinstance(transport, httpx.AsyncBaseTransport):
+            raise TypeError(
+                "AsyncTopvisorAPI requires an httpx.AsyncBaseTransport such as httpx.MockTransport, "
+                f"got {type(transport).__name__}; RecordingTransport and ReplayTransport "
+                "only work with TopvisorAPI"
+            )
+        keepalive = pool_maxsize if self.keep_alive else 0
+        limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=keepalive)
+        if self.http2:
+            try:
+                return httpx.AsyncClient(limits=limits, transport=transport, http2=True)
+            except ImportError:
+                logger.warning("HTTP/2 requires the h2 package (pip install pytopvisor[http2]); using HTTP/1.1")
+                self.http2 = False
+        return httpx.AsyncClient(limits=limits, transport=transport)
+
+    @property
+    def semaphore(self):
+        # Created lazily so that it is bound to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self):
+        """
+        Closes the client and releases all pooled connections.
+        """
+        await self.transport.aclose()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncTopvisorAPI")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _post(self, url, payload, timeout=None, stream=False, event=None):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        data = self.json_codec.dumps(payload)
+        request = self.transport.build_request(
+            "POST",
+            url,
+            headers=self.headers,
+            content=data,
+            timeout=self._httpx_timeout(timeout or self.timeout),
+        )
+        async with self.semaphore:
+            started = time.perf_counter()
+            response = await self.transport.send(request, stream=True)
+            headers_received = time.perf_counter()
+            if not stream:
+                # Same as send(stream=False), split to time the body separately
+                try:
+                    await response.aread()
+                except BaseException:
+                    await response.aclose()
+                    raise
+        if event is not None:
+            event.payload_bytes = len(data)
+            event.status_code = response.status_code
+            event.time_to_headers = headers_received - started
+            if not stream:
+                event.transfer_time = time.perf_counter() - headers_received
+                event.response_bytes = len(response.content)
+                event.wire_bytes = wire_bytes(response, event.response_bytes)
+        return response
+
+    @staticmethod
+    def _httpx_timeout(timeout):
+        """
+        Converts a requests-style (connect, read) tuple to httpx.Timeout.
+        """
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return timeout
+
+    async def _with_retries(self, func, endpoint, payload, timeout=None, event=None):
+        """
+        Awaits func(endpoint, payload, timeout, event), retrying transient failures per retry_policy.
+        An event passed in by the caller is only updated; the caller emits it.
+        """
+        owns_event = event is None
+        if owns_event:
+            event = self._start_event(endpoint, payload)
+        attempt = 1
+        while True:
+            if self.circuit_breaker is not None:
+                try:
+                    self.circuit_breaker.before_request()
+                except CircuitOpenError as e:
+                    if owns_event:
+                        self._emit(event, e)
+                    raise
+            try:
+                result = await func(endpoint, payload, timeout, event)
+            except Exception as e:
+                self._record_outcome(e)
+                if not self.retry_policy.should_retry(e, attempt, self.transport_errors):
+                    if owns_event:
+                        self._emit(event, e)
+                    raise
+                await asyncio.sleep(self._get_retry_delay(endpoint, e, attempt))
+                attempt += 1
+                if event is not None:
+                    event.retries += 1
+            except BaseException:
+                # Cancelled or interrupted: no outcome, but a half-open trial must not stay taken
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.release()
+                raise
+            else:
+                self._record_outcome(None)
+                if owns_event:
+                    self._emit(event)
+                return result
+
+    async def _cached(self, func, endpoint, payload, timeout=None):
+        """
+        Awaits func through _with_retries, with the cache and coalescing rules of TopvisorAPI._cached.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, payload, self.cache_scope)
+            if cached is not None:
+                return cached
+        if self.single_flight is not None:
+            result = await self.single_flight.do(
+                make_cache_key(endpoint, payload),
+                self._with_retries,
+                func,
+                endpoint,
+                payload,
+                timeout,
+            )
+        else:
+            result = await self._with_retries(func, endpoint, payload, timeout)
+        if self.cache is not None:
+            self.cache.set(endpoint, payload, result, self.cache_scope)
+        return result
+
+    async def send_request(self, endpoint, payload, timeout=None):
+        """
+        Sends a JSON request, retrying transient failures according to retry_policy.
+        Served from the cache when one is configured; concurrent identical
+        calls share one request when coalescing is enabled.
+        """
+        return await self._cached(self._send_request, endpoint, payload, timeout)
+
+    async def send_text_request(self, endpoint, payload, timeout=None):
+        """
+        Sends a request returning CSV text, retrying transient failures according to retry_policy.
+        Served from the cache when one is configured; concurrent identical
+        calls share one request when coalescing is enabled.
+        """
+        return await self._cached(self._send_text_request, endpoint, payload, timeout)
+
+    async def _send_request(self, endpoint, payload, timeout=None, event=None):
+
+        try:
+            url = f"{self.base_url}{endpoint}"
+            payload = payload or {}
+            response = await self._post(url, payload, timeout, event=event)
+            self._raise_for_status(url, response)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API request completed successfully: %s", url)
+
+            parse_started = time.perf_counter()
+            try:
+                data = self.json_codec.loads(response.content)
+            except ValueError as e:
+                logger.error("JSON parsing error: %s. Response: %s", e, response.text)
+                raise RuntimeError("Response from API is not valid JSON.")
+            if event is not None:
+                event.parse_time = time.perf_counter() - parse_started
+
+            if "errors" in data and data["errors"]:
+                retry_after = RetryPolicy.parse_retry_after(response.headers.get("Retry-After"))
+                self._handle_api_errors(url, data["errors"], retry_after=retry_after)
+
+            return data
+
+        except httpx.HTTPError as e:
+            logger.error("Error during API request: %s", e)
+            raise
+
+    async def _send_text_request(self, endpoint, payload, timeout=None, event=None):
+        try:
+            url = f"{self.base_url}{endpoint}"
+            response = await self._post(url, payload, timeout, event=event)
+            self._raise_for_status(url, response)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API request completed successfully: %s", url)
+            parse_started = time.perf_counter()
+            rows = self.parse_text_content(response.content)
+            if event is not None:
+                event.parse_time = time.perf_counter() - parse_started
+            return rows
+
+        except httpx.HTTPError as e:
+            logger.error("Error during API request: %s", e)
+            raise
+
+    async def _open_stream(self, endpoint, payload, timeout=None, event=None):
+        url = f"{self.base_url}{endpoint}"
+        response = await self._post(url, payload, timeout, stream=True, event=event)
+        try:
+            self._raise_for_status(url, response)
+        except Exception:
+            await response.aclose()
+            raise
+        return response
+
+    async def iter_text_rows(self, endpoint, payload, delimiter=";", typed=False, timeout=None):
+        """
+        Streams a CSV export row by row without loading the whole body.
+
+        Only establishing the response is retried; errors while reading the body are raised.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param delimiter: Delimiter used in the text (default ';').
+        :param typed: If True, treat the first row as a header and yield namedtuples.
+        :param timeout: (connect, read) timeout (default: client timeout).
+        :return: Async generator of rows.
+        """
+        event = self._start_event(endpoint, payload)
+        error = None
+        try:
+            response = await self._with_retries(self._open_stream, endpoint, payload, timeout, event)
+            parser = CsvStreamParser(delimiter=delimiter, typed=typed)
+            try:
+                async for chunk in atrack_chunks(response.aiter_bytes(), event, response):
+                    for row in parser.feed(chunk):
+                        yield row
+                for row in parser.close():
+                    yield row
+            except httpx.HTTPError as e:
+                logger.error("Error during API request: %s", e)
+                raise
+            finally:
+                await response.aclose()
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._emit(event, error)
+
+    async def iter_json_records(self, endpoint, payload, path=("result", "keywords"), timeout=None):
+        """
+        Streams the items of one array of a JSON response while the body is downloaded.
+
+        Peak memory is about one item instead of the whole response. API errors
+        are checked once the body has been read completely.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param path: Keys leading to the array (default: result.keywords).
+        :param timeout: (connect, read) timeout (default: client timeout).
+        :return: Async generator of array items.
+        """
+        url = f"{self.base_url}{endpoint}"
+        event = self._start_event(endpoint, payload)
+        error = None
+        attempt = 1
+        try:
+            while True:
+                if event is not None:
+                    event.start_attempt()
+                response = await self._with_retries(self._open_stream, endpoint, payload or {}, timeout, event)
+                parser = JsonRecordStreamParser(path)
+                yielded = False
+                try:
+                    async for chunk in atrack_chunks(response.aiter_bytes(), event, response):
+                        for record in parser.feed(chunk):
+                            yielded = True
+                            yield record
+                    records = parser.close()
+                except httpx.HTTPError as e:
+                    logger.error("Error during API request: %s", e)
+                    raise
+                except ValueError as e:
+                    logger.error("JSON parsing error: %s", e)
+                    raise RuntimeError("Response from API is not valid JSON.")
+                finally:
+                    await response.aclose()
+
+                envelope = parser.envelope or {}
+                if envelope.get("errors"):
+                    try:
+                        self._handle_api_errors(url, envelope["errors"])
+                    except TopvisorAPIError as e:
+                        # Retrying is only safe if nothing has been yielded yet
+                        if yielded or not self.retry_policy.should_retry(e, attempt):
+                            raise
+                        await asyncio.sleep(self._get_retry_delay(endpoint, e, attempt))
+                        attempt += 1
+                        if event is not None:
+                            event.retries += 1
+                        continue
+                for record in records:
+                    yield record
+                return
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._emit(event, error)
+
+    async def send_many(self, endpoint, payloads, combine=None, timeout=None):
+        """
+        Sends several requests to one endpoint concurrently.
+        :param endpoint: API endpoint.
+        :param payloads: List of request payloads.
+        :param combine: Function merging the list of responses into one result (optional).
+        :param timeout: (connect, read) timeout for every request (default: client timeout).
+        :return: List of responses in payload order, or the value returned by combine.
+        """
+        responses = await asyncio.gather(
+            *(self.send_request(endpoint, payload, timeout) for payload in payloads)
+        )
+        return combine(list(responses)) if combine else list(responses)
+
+    async def iter_pages(self, endpoint, payload, limit=10000, workers=None, timeout=None):
+        """
+        Asynchronously iterates over paginated responses one page at a time.
+
+        Pages are yielded in offset order. Once the first page reports "total",
+        up to `workers` following pages are requested ahead.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param limit: Number of items per request (default: 10000).
+        :param workers: Number of concurrent page requests (default: fetch_workers).
+        :param timeout: (connect, read) timeout for every page request (default: client timeout).
+        :return: Async generator of page responses.
+        """
+        workers = max(1, workers or self.fetch_workers)
+        payload = payload.copy()
+        payload["limit"] = limit
+        payload["offset"] = 0
+
+        data = self._check_page(await self.send_request(endpoint, payload, timeout))
+        fetched = len(data["result"])
+        total = data.get("total")
+        yield data
+
+        if len(data["result"]) < limit or (total is not None and fetched >= total):
+            return
+
+        if total is None:
+            while True:
+                payload["offset"] += limit
+                data = self._check_page(await self.send_request(endpoint, payload, timeout))
+                fetched += len(data["result"])
+                total = data.get("total", total)
+                yield data
+                if total is not None and fetched >= total:
+                    return
+                if len(data["result"]) < limit:
+                    return
+
+        payloads = iter(self._remaining_payloads(payload, limit, total))
+        pending = deque(
+            asyncio.ensure_future(self.send_request(endpoint, page, timeout))
+            for page in islice(payloads, workers)
+        )
+        try:
+            while pending:
+                data = self._check_page(await pending.popleft())
+                page = next(payloads, None)
+                if page is not None:
+                    pending.append(asyncio.ensure_future(self.send_request(endpoint, page, timeout)))
+                yield data
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_results(self, endpoint, payload, limit=10000, workers=None, timeout=None):
+        """
+        Asynchronously iterates over the records of all pages.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param limit: Number of items per request (default: 10000).
+        :param workers: Number of concurrent page requests (default: fetch_workers).
+        :param timeout: (connect, read) timeout for every page request (default: client timeout).
+        :return: Async generator of result records.
+        """
+        async for data in self.iter_pages(endpoint, payload, limit=limit, workers=workers, timeout=timeout):
+            for item in data["result"]:
+                yield item
+
+    async def fetch_all(self, endpoint, payload, limit=10000, workers=None, timeout=None):
+        """
+        Fetches all data from an endpoint with pagination.
+
+        The first page is requested alone. If it reports "total", the remaining
+        pages are requested concurrently and merged back in offset order.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param limit: Number of items per request (default: 10000).
+        :param workers: Number of concurrent page requests (default: fetch_workers).
+        :param timeout: (connect, read) timeout for every page request (default: client timeout).
+        :return: List of all results.
+        """
+        result = []
+        total = None
+        async for data in self.iter_pages(endpoint, payload, limit=limit, workers=workers, timeout=timeout):
+            result.extend(data["result"])
+            total = data.get("total", total)
+        return {"result": result, "total": total}
@@ -1,25 +1,126 @@
 from abc import ABC
 
+from pytopvisor.services.registry import get_endpoint
+from pytopvisor.utils.payload import PAYLOAD_SCHEMAS
+from pytopvisor.utils.validators import Validator
+
 
 class BaseService(ABC):
+    """
+    Base class for API services.
+
+    Requests are delegated to the API client, so the same service works with
+    both TopvisorAPI and AsyncTopvisorAPI (in the latter case methods return awaitables).
+    """
+
     def __init__(self, api_client):
         super().__init__()
         self.api_client = api_client
 
-    def send_request(self, endpoint, payload, fetch_all=False, limit=10000):
+    def prepare(self, operation, params):
+        """
+        Validates the parameters of a registered operation and builds its payload.
+        :param operation: Operation name (key of the endpoint registry).
+        :param params: Method parameters (e.g. locals()).
+        :return: Tuple (Endpoint, payload).
+        """
+        endpoint = get_endpoint(operation)
+        Validator.compile(operation)(params)
+        return endpoint, PAYLOAD_SCHEMAS[endpoint.schema].build(params)
+
+    def call(self, operation, params, options=None):
+        """
+        Executes a registered operation.
+        :param operation: Operation name (key of the endpoint registry).
+        :param params: Method parameters (e.g. locals()).
+        :param options: Execution options: fetch_all, limit, stream, typed_rows.
+        :return: Result of the request as returned by dispatch.
+        """
+        endpoint, payload = self.prepare(operation, params)
+        return self.dispatch(endpoint, payload, options or {})
+
+    def dispatch(self, endpoint, payload, options):
+        """
+        Sends a prepared payload the way the endpoint declares: CSV export,
+        streamed JSON document or (paginated) JSON response. fetch_all and
+        stream only paginate endpoints declared as paginated; other
+        endpoints are sent as a single request.
+        """
+        stream = options.get("stream", False)
+        if endpoint.response == "text":
+            return self.send_text_request(
+                endpoint.path, payload, stream=stream, typed=options.get("typed_rows", False)
+            )
+        if stream and endpoint.records_path is not None:
+            # Not a paginated list: parse records while the body arrives
+            return self.stream_records(endpoint.path, payload, path=endpoint.records_path)
+        return self.send_request(
+            endpoint.path,
+            payload,
+            fetch_all=options.get("fetch_all", False) and endpoint.paginated,
+            limit=options.get("limit", 10000),
+            stream=stream and endpoint.paginated,
+        )
+
+    def send_request(self, endpoint, payload, fetch_all=False, limit=10000, stream=False):
         """
         Sends a request to the API, optionally fetching all paginated data.
         :param endpoint: API endpoint.
         :param payload: Request payload.
         :param fetch_all: If True, fetch all paginated data.
-        :param limit: Pagination limit (used if fetch_all=True).
-        :return: API response or list of all results if fetch_all=True.
+        :param limit: Pagination limit (used if fetch_all=True or stream=True).
+        :param stream: If True, return an iterator over records of all pages.
+        :return: API response, list of all results if fetch_all=True,
+            or an iterator of records if stream=True.
         """
+        if stream:
+            return self.iter_results(endpoint, payload, limit=limit)
         if fetch_all:
             return self.api_client.fetch_all(endpoint, payload, limit=limit)
         return self.api_client.send_request(endpoint, payload)
 
-    def send_text_request(self, endpoint, payload):
+    def send_many(self, endpoint, payloads, combine=None):
+        """
+        Sends several requests to one endpoint concurrently.
+        :param endpoint: API endpoint.
+        :param payloads: List of request payloads.
+        :param combine: Function merging the list of responses into one result (optional).
+        :return: List of responses, or the value returned by combine.
+        """
+        return self.api_client.send_many(endpoint, payloads, combine=combine)
+
+    def stream_records(self, endpoint, payload, path=("result", "keywords")):
+        """
+        Iterates over the items of one array of a large JSON response while it is downloaded.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param path: Keys leading to the array (default: result.keywords).
+        :return: Iterator of records.
+        """
+        return self.api_client.iter_json_records(endpoint, payload, path=path)
+
+    def iter_pages(self, endpoint, payload, limit=10000):
+        """
+        Iterates over paginated responses one page at a time.
+        """
+        return self.api_client.iter_pages(endpoint, payload, limit=limit)
 
+    def iter_results(self, endpoint, payload, limit=10000):
+        """
+        Iterates over the records of all pages.
+        """
+        return self.api_client.iter_results(endpoint, payload, limit=limit)
+
+    def send_text_request(self, endpoint, payload, stream=False, typed=False):
+        """
+        Sends a request returning a CSV export.
+        :param endpoint: API endpoint.
+        :param payload: Request payload.
+        :param stream: If True, return an iterator of rows parsed while the body is downloaded.
+        :param typed: With stream=True, treat the first row as a header and yield namedtuples.
+        :return: List of rows or an iterator of rows if stream=True.
+        """
+        if stream:
+            return self.api_client.iter_text_rows(endpoint, payload, typed=typed)
         return self.api_client.send_text_request(endpoint, payload)
 
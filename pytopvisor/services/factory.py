@@ -1,23 +1,45 @@
-from pytopvisor.services.projects import ProjectsService
-from pytopvisor.services.positions import PositionsService
-from pytopvisor.services.snapshots import SnapshotsService
+import threading
+
+from pytopvisor.services.registry import SERVICES, import_object
+
 
 class ServiceFactory:
+    _classes = {}
+    _classes_lock = threading.Lock()
+
     def __init__(self, api_client):
         self.api_client = api_client
         self._services = {}
+        self._lock = threading.Lock()
 
-    def get_service(self, service_name):
-
-        if service_name not in self._services:
-
-            if service_name == "projects":
-                self._services[service_name] = ProjectsService(self.api_client)
-            elif service_name == "positions":
-                self._services[service_name] = PositionsService(self.api_client)
-            elif service_name == "snapshots":
-                self._services[service_name] = SnapshotsService(self.api_client)
-
-            else:
+    @classmethod
+    def get_service_class(cls, service_name):
+        """
+        Resolves a service name to its class, importing the module on first use.
+        Safe to call from several threads: every module is imported once.
+        """
+        service_class = cls._classes.get(service_name)
+        if service_class is None:
+            if service_name not in SERVICES:
                 raise ValueError(f"Unknown service: {service_name}")
-        return self._services[service_name]
+            with cls._classes_lock:
+                service_class = cls._classes.get(service_name)
+                if service_class is None:
+                    service_class = import_object(SERVICES[service_name])
+                    cls._classes[service_name] = service_class
+        return service_class
+
+    def get_service(self, service_name):
+        """
+        Returns the service instance, creating it on first use.
+        Threads sharing the factory always get the same instance.
+        """
+        service = self._services.get(service_name)
+        if service is None:
+            service_class = self.get_service_class(service_name)
+            with self._lock:
+                service = self._services.get(service_name)
+                if service is None:
+                    service = service_class(self.api_client)
+                    self._services[service_name] = service
+        return service
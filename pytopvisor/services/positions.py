@@ -1,22 +1,12 @@
 from pytopvisor.services.base import BaseService
-from pytopvisor.utils.payload import PayloadFactory
-from pytopvisor.utils.validators import Validator
+from pytopvisor.utils.validators import ValidationError
+from pytopvisor.utils.dates import split_date_range
+from pytopvisor.utils.merge import merge_positions_history
 from typing import List, Optional
-from inspect import signature
 
 
 class PositionsService(BaseService):
 
-    def __init__(self, api_client):
-        super().__init__(api_client)
-        self.endpoints = {
-            "history": "/v2/json/get/positions_2/history",
-            "summary": "/v2/json/get/positions_2/summary",
-            "summary_chart": "/v2/json/get/positions_2/summary/chart",
-            "checker_price": "/v2/json/get/positions_2/checker/price",
-            "searchers_regions_export": "/v2/json/get/positions_2/searchers/regions/export",
-        }
-
     def get_positions_history(
         self,
         project_id: int,
@@ -35,6 +25,7 @@ class PositionsService(BaseService):
         positions_fields: Optional[List[str]] = None,
         filter_by_dynamic: Optional[List[str]] = None,
         filter_by_positions: Optional[List[List[int]]] = None,
+        window_days: Optional[int] = None,
         **kwargs
     ):
         """
@@ -55,14 +46,25 @@ class PositionsService(BaseService):
         :param positions_fields: Select columns of data with check results.
         :param filter_by_dynamic: Filter by keyword dynamics.
         :param filter_by_positions: Filter by keyword positions.
-        :return: Request result.
+        :param window_days: Split the date1-date2 period into windows of this many days,
+            fetch them concurrently and merge the keyword series into one result.
+        :return: Request result, or an iterator of keyword records if stream=True.
         """
 
-        Validator.validate("get_positions_history", **locals())
-        payload = PayloadFactory.positions_get_history_payload(**locals())
-        fetch_all = kwargs.get("fetch_all", False)
-        limit = kwargs.get("limit", 10000)
-        return self.send_request(self.endpoints["history"], payload, fetch_all=fetch_all, limit=limit)
+        endpoint, payload = self.prepare("get_positions_history", locals())
+        if window_days is not None:
+            if date1 is None or date2 is None:
+                raise ValidationError("'window_days' requires 'date1' and 'date2'")
+            if not isinstance(window_days, int) or window_days < 1:
+                raise ValidationError("'window_days' must be a positive integer")
+            if kwargs.get("fetch_all") or kwargs.get("stream"):
+                raise ValidationError("'window_days' cannot be combined with 'fetch_all' or 'stream'")
+            payloads = [
+                {**payload, "date1": window_start, "date2": window_end}
+                for window_start, window_end in split_date_range(date1, date2, window_days)
+            ]
+            return self.send_many(endpoint.path, payloads, combine=merge_positions_history)
+        return self.dispatch(endpoint, payload, kwargs)
 
 
     def get_positions_summary(
@@ -94,12 +96,7 @@ class PositionsService(BaseService):
         :return: Request result.
         """
 
-        Validator.validate("get_positions_summary", **locals())
-        payload = PayloadFactory.positions_get_summary_payload(**locals())
-        fetch_all = kwargs.get("fetch_all", False)
-        limit = kwargs.get("limit", 10000)
-
-        return self.send_request(self.endpoints["summary"], payload, fetch_all=fetch_all, limit=limit)
+        return self.call("get_positions_summary", locals(), kwargs)
 
 
 
@@ -133,11 +130,7 @@ class PositionsService(BaseService):
         :param show_visibility: Add visibility (boolean).
         :return: Request result.
         """
-        Validator.validate("get_positions_summary_chart", **locals())
-        payload = PayloadFactory.positions_get_summary_chart_payload(**locals())
-        fetch_all = kwargs.get("fetch_all", False)
-        limit = kwargs.get("limit", 10000)
-        return self.send_request(self.endpoints["summary_chart"], payload, fetch_all=fetch_all, limit=limit)
+        return self.call("get_positions_summary_chart", locals(), kwargs)
 
 
     def get_searchers_regions(
@@ -160,11 +153,7 @@ class PositionsService(BaseService):
         :param lang: Interface language.
         :param device: Device type (enum: 0, 1, 2).
         :param depth: Check depth.
-        :return: Request result.
+        :return: Request result (list of rows, or an iterator of rows if stream=True;
+            typed_rows=True yields namedtuples built from the header row).
         """
-        Validator.validate("get_searchers_regions", **locals())
-        payload = PayloadFactory.positions_get_searchers_regions_payload(**locals())
-
-        return self.send_text_request(
-            self.endpoints["searchers_regions_export"], payload
-        )
+        return self.call("get_searchers_regions", locals(), kwargs)
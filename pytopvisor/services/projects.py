@@ -1,16 +1,8 @@
 from pytopvisor.services.base import BaseService
-from pytopvisor.utils.payload import PayloadFactory
-from pytopvisor.utils.validators import Validator
 from typing import Optional
 
 
 class ProjectsService(BaseService):
-    def __init__(self, api_client):
-        super().__init__(api_client)
-        self.endpoints = {
-            "projects": "/v2/json/get/projects_2/projects",
-            "competitors": "/v2/json/get/projects_2/competitors",
-        }
 
     def get_projects(
         self,
@@ -22,11 +14,7 @@ class ProjectsService(BaseService):
         """
         Retrieves a list of projects.
         """
-        Validator.validate("get_projects", **locals())
-        payload = PayloadFactory.projects_get_projects_payload(**locals())
-        fetch_all = kwargs.get("fetch_all", False)
-        limit = kwargs.get("limit", 10000)
-        return self.send_request(self.endpoints["projects"], payload, fetch_all=fetch_all, limit=limit)
+        return self.call("get_projects", locals(), kwargs)
 
     def get_competitors(
         self,
@@ -38,8 +26,4 @@ class ProjectsService(BaseService):
         """
         Retrieves a list of competitors.
         """
-        Validator.validate("get_competitors", **locals())
-        payload = PayloadFactory.projects_get_competitors_payload(**locals())
-        fetch_all = kwargs.get("fetch_all", False)
-        limit = kwargs.get("limit", 10000)
-        return self.send_request(self.endpoints["competitors"], payload, fetch_all=fetch_all, limit=limit)
+        return self.call("get_competitors", locals(), kwargs)
@@ -0,0 +1,120 @@
+from importlib import import_module
+from typing import Any, Dict, Optional, Tuple
+
+
+class Endpoint:
+    """
+    Declarative description of a Topvisor API operation.
+    """
+
+    __slots__ = ("operation", "service", "path", "schema", "paginated", "response", "records_path")
+
+    def __init__(
+        self,
+        operation: str,
+        service: str,
+        path: str,
+        schema: str,
+        paginated: bool = True,
+        response: str = "json",
+        records_path: Optional[Tuple[str, ...]] = None,
+    ):
+        """
+        :param operation: Operation name used by run_task; also the ValidationRules key.
+        :param service: Name of the service implementing the operation.
+        :param path: API endpoint path.
+        :param schema: PAYLOAD_SCHEMAS key used to build the payload.
+        :param paginated: The result is a list paginated with limit/offset (default: True).
+        :param response: Response type: "json" or "text" (CSV export).
+        :param records_path: Keys of the array streamed record by record when stream=True
+            (for responses that are single documents rather than paginated lists).
+        """
+        self.operation = operation
+        self.service = service
+        self.path = path
+        self.schema = schema
+        self.paginated = paginated
+        self.response = response
+        self.records_path = records_path
+
+
+ENDPOINTS: Dict[str, Endpoint] = {
+    endpoint.operation: endpoint
+    for endpoint in (
+        Endpoint(
+            "get_projects",
+            "projects",
+            "/v2/json/get/projects_2/projects",
+            "projects_get_projects",
+        ),
+        Endpoint(
+            "get_competitors",
+            "projects",
+            "/v2/json/get/projects_2/competitors",
+            "projects_get_competitors",
+        ),
+        Endpoint(
+            "get_positions_history",
+            "positions",
+            "/v2/json/get/positions_2/history",
+            "positions_get_history",
+            paginated=False,
+            records_path=("result", "keywords"),
+        ),
+        Endpoint(
+            "get_positions_summary",
+            "positions",
+            "/v2/json/get/positions_2/summary",
+            "positions_get_summary",
+            paginated=False,
+        ),
+        Endpoint(
+            "get_positions_summary_chart",
+            "positions",
+            "/v2/json/get/positions_2/summary/chart",
+            "positions_get_summary_chart",
+            paginated=False,
+        ),
+        Endpoint(
+            "get_searchers_regions",
+            "positions",
+            "/v2/json/get/positions_2/searchers/regions/export",
+            "positions_get_searchers_regions",
+            paginated=False,
+            response="text",
+        ),
+        Endpoint(
+            "get_snapshots_history",
+            "snapshots",
+            "/v2/json/get/snapshots_2/history",
+            "snapshots_get_history",
+            paginated=False,
+            records_path=("result", "keywords"),
+        ),
+    )
+}
+
+# Service classes by name, as "module:ClassName"; imported on first use
+SERVICES: Dict[str, str] = {
+    "projects": "pytopvisor.services.projects:ProjectsService",
+    "positions": "pytopvisor.services.positions:PositionsService",
+    "snapshots": "pytopvisor.services.snapshots:SnapshotsService",
+}
+
+
+def import_object(path: str) -> Any:
+    """
+    Imports an object given as "module:name".
+    """
+    module_name, name = path.split(":")
+    return getattr(import_module(module_name), name)
+
+
+def get_endpoint(operation: str) -> Endpoint:
+    """
+    Returns the registry entry for an operation.
+    """
+    try:
+        return ENDPOINTS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown operation: {operation}") from None
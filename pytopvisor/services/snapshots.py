@@ -1,19 +1,9 @@
 from pytopvisor.services.base import BaseService
-from pytopvisor.utils.payload import PayloadFactory
-from pytopvisor.utils.validators import Validator
 from typing import List, Optional
-from inspect import signature
 
 
 class SnapshotsService(BaseService):
 
-    def __init__(self, api_service):
-        super().__init__(api_service)
-        self.endpoints = {
-            "history": "/v2/json/get/snapshots_2/history",
-            "competitors": "/v2/json/get/snapshots_2/competitors",
-        }
-
     def get_snapshots_history(
         self,
         project_id: int,
@@ -40,10 +30,6 @@ class SnapshotsService(BaseService):
         :param show_exists_dates: Add check dates.
         :param show_ams: Add to the result the storm index between the selected checks.
         :param positions_fields: Select columns of data with check results.
-        :return: Request result.
+        :return: Request result, or an iterator of keyword records if stream=True.
         """
-        Validator.validate("get_snapshots_history", **locals())
-        payload = PayloadFactory.snapshots_get_history_payload(**locals())
-        fetch_all = kwargs.get("fetch_all", False)
-        limit = kwargs.get("limit", 10000)
-        return self.send_request(self.endpoints["history"], payload, fetch_all=fetch_all, limit=limit)
\ No newline at end of file
+        return self.call("get_snapshots_history", locals(), kwargs)
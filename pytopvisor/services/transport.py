@@ -0,0 +1,347 @@
+import base64
+import gzip
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pytopvisor.utils.logger import logger
+from pytopvisor.utils.metrics import wire_bytes
+
+# Response headers kept in cassettes; bodies are stored decoded, so encoding headers are dropped
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+
+def accept_encoding():
+    """
+    Returns the Accept-Encoding value listing the content codings requests and httpx
+    can decode while streaming: gzip and deflate, plus br if brotli is installed.
+    """
+    from importlib.util import find_spec
+
+    encodings = ["gzip", "deflate"]
+    if find_spec("brotli") is not None or find_spec("brotlicffi") is not None:
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+class CassetteMissError(LookupError):
+    """
+    Raised by ReplayTransport for a request that is not in the cassette.
+    """
+
+
+class Transport(ABC):
+    """
+    Sends HTTP POST requests for TopvisorAPI.
+
+    Implementations return requests.Response objects (or objects with the same
+    status_code, headers, content, text, elapsed, iter_content(), raise_for_status()
+    and close() members).
+    """
+
+    @abstractmethod
+    def post(self, url, headers, data, timeout=None, stream=False):
+        """
+        :param url: Request URL.
+        :param headers: Request headers.
+        :param data: Encoded request body (bytes).
+        :param timeout: (connect, read) timeout in seconds.
+        :param stream: If True, the body may be read later with iter_content().
+        :return: Response.
+        """
+
+    def close(self):
+        """
+        Releases connections and files held by the transport.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport: a requests.Session with a pooled keep-alive adapter.
+
+    The session is shared by all threads; every request checks a connection out of
+    the thread-safe urllib3 pool, so concurrent requests never share a socket.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False):
+        """
+        :param pool_connections: Number of connection pools to cache (default: 10).
+        :param pool_maxsize: Maximum number of connections kept per pool (default: 10).
+        :param pool_block: If True, requests wait for a free pooled connection instead of
+            opening extra connections that are discarded afterwards (default: False).
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def post(self, url, headers, data, timeout=None, stream=False):
+        return self.session.post(url, headers=headers, data=data, timeout=timeout, stream=stream)
+
+    def close(self):
+        self.session.close()
+
+
+class HttpxResponse:
+    """
+    Adapts an httpx.Response to the subset of the requests.Response interface
+    used by TopvisorAPI, translating httpx exceptions to requests ones.
+    """
+
+    def __init__(self, response, elapsed):
+        self.raw = response
+        self.url = str(response.url)
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.http_version = response.http_version
+        self.elapsed = timedelta(seconds=elapsed)
+
+    @property
+    def wire_bytes(self):
+        return self.raw.num_bytes_downloaded
+
+    @property
+    def content(self):
+        with _translate_httpx_errors():
+            return self.raw.read()
+
+    @property
+    def text(self):
+        with _translate_httpx_errors():
+            self.raw.read()
+        return self.raw.text
+
+    def iter_content(self, chunk_size=None):
+        with _translate_httpx_errors():
+            yield from self.raw.iter_bytes(chunk_size)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+    def close(self):
+        self.raw.close()
+
+
+@contextmanager
+def _translate_httpx_errors():
+    """
+    Re-raises httpx transport errors as the requests exceptions TopvisorAPI retries.
+    """
+    import httpx
+
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+
+
+class HttpxTransport(Transport):
+    """
+    Transport built on httpx.Client with optional HTTP/2 (requires pip install pytopvisor[http2]).
+
+    With HTTP/2 concurrent requests to the same host are multiplexed as streams
+    over one connection instead of opening a connection each. The protocol is
+    negotiated per connection (ALPN), so servers without HTTP/2 are served over
+    HTTP/1.1; if the h2 package is missing, the transport falls back to HTTP/1.1
+    with a warning.
+    """
+
+    def __init__(self, http2=True, pool_maxsize=10, keep_alive=True, client=None):
+        """
+        :param http2: Negotiate HTTP/2 where the server supports it (default: True).
+        :param pool_maxsize: Maximum number of connections (default: 10).
+        :param keep_alive: Reuse connections between requests (default: True).
+        :param client: Preconfigured httpx.Client to use instead of creating one.
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("HttpxTransport requires httpx. Install it with: pip install pytopvisor[http2]")
+
+        self.http2 = http2
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            )
+            client = self._create_client(limits, http2)
+        self.client = client
+
+    def _create_client(self, limits, http2):
+        import httpx
+
+        if http2:
+            try:
+                return httpx.Client(limits=limits, http2=True)
+            except ImportError:
+                logger.warning("HTTP/2 requires the h2 package (pip install pytopvisor[http2]); using HTTP/1.1")
+                self.http2 = False
+        return httpx.Client(limits=limits)
+
+    def post(self, url, headers, data, timeout=None, stream=False):
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        request = self.client.build_request("POST", url, headers=headers, content=data, timeout=timeout)
+        started = time.perf_counter()
+        with _translate_httpx_errors():
+            response = self.client.send(request, stream=True)
+        elapsed = time.perf_counter() - started
+        response = HttpxResponse(response, elapsed)
+        if not stream:
+            try:
+                response.content
+            finally:
+                response.close()
+        return response
+
+    def close(self):
+        self.client.close()
+
+
+def _request_key(url, data):
+    """
+    Matches requests by URL path and canonical JSON body, so cassettes recorded
+    against one host replay against any base_url and key order does not matter.
+    """
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    try:
+        body = json.dumps(json.loads(data or b"{}"), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        body = data.decode("utf-8", "replace") if isinstance(data, bytes) else str(data)
+    return path, body
+
+
+def build_response(url, status_code, headers, content, elapsed=0.0):
+    """
+    Creates a fully read requests.Response from recorded data.
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.elapsed = timedelta(seconds=elapsed)
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests to another transport and appends every exchange to a cassette.
+
+    The cassette is a gzip-compressed JSON lines file: one line per request with
+    the URL path, request body, status, selected headers, the decoded response
+    body, the number of bytes it took on the wire and its timing. Request headers (credentials) are never written.
+    Streamed responses are read completely before they are returned.
+    """
+
+    def __init__(self, path, transport=None):
+        """
+        :param path: Cassette file to write (e.g. "topvisor.jsonl.gz"); an existing file is replaced.
+        :param transport: Transport making the real requests (default: RequestsTransport()).
+        """
+        self.path = path
+        self.transport = transport or RequestsTransport()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def post(self, url, headers, data, timeout=None, stream=False):
+        started = time.perf_counter()
+        response = self.transport.post(url, headers, data, timeout=timeout, stream=stream)
+        content = response.content
+        duration = time.perf_counter() - started
+        path, body = _request_key(url, data)
+        record = {
+            "url": path,
+            "request": body,
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "elapsed": response.elapsed.total_seconds(),
+            "duration": duration,
+            "wire_bytes": wire_bytes(response, len(content)),
+        }
+        try:
+            record["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body_b64"] = base64.b64encode(content).decode("ascii")
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+        return response
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Serves responses from a cassette written by RecordingTransport, without network access.
+
+    Identical requests recorded several times are replayed in recorded order;
+    once exhausted, the last response is repeated.
+    """
+
+    def __init__(self, path, latency=False):
+        """
+        :param path: Cassette file.
+        :param latency: If True, delay every response by its recorded duration;
+            otherwise replay at full speed (default: False).
+        """
+        self.path = path
+        self.latency = latency
+        self._records = {}
+        self._lock = threading.Lock()
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._records.setdefault((record["url"], record["request"]), deque()).append(record)
+
+    def __len__(self):
+        return sum(len(records) for records in self._records.values())
+
+    def post(self, url, headers, data, timeout=None, stream=False):
+        key = _request_key(url, data)
+        with self._lock:
+            records = self._records.get(key)
+            if not records:
+                raise CassetteMissError(f"No recorded response for {key[0]} with payload {key[1]}")
+            record = records.popleft() if len(records) > 1 else records[0]
+        if self.latency:
+            time.sleep(record["duration"])
+        if "body" in record:
+            content = record["body"].encode("utf-8")
+        else:
+            content = base64.b64decode(record["body_b64"])
+        response = build_response(url, record["status"], record["headers"], content, record["elapsed"])
+        response.wire_bytes = record.get("wire_bytes", len(content))
+        return response
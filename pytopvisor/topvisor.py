@@ -1,11 +1,41 @@
-from pytopvisor.services.api import TopvisorAPI
 from pytopvisor.services.factory import ServiceFactory
+from pytopvisor.services.registry import ENDPOINTS, import_object
+from pytopvisor.utils.tasks import TaskResult, expand_grid, normalize_task_spec
 
 
 class Topvisor:
-    def __init__(self, user_id, api_key):
-        self.api_client = TopvisorAPI(user_id, api_key)
+    # API client class as "module:name"; the transport is imported when a client is created
+    api_class = "pytopvisor.services.api:TopvisorAPI"
+    # Operation name -> (service, method), generated from the endpoint registry
+    operation_mapping = {
+        operation: (endpoint.service, operation) for operation, endpoint in ENDPOINTS.items()
+    }
+
+    def __init__(self, user_id, api_key, **api_options):
+        """
+        :param user_id: Topvisor user ID.
+        :param api_key: Topvisor API key.
+        :param api_options: Transport options passed to the API client
+            (pool_connections, pool_maxsize, pool_block, keep_alive, hooks, transport, http2).
+        """
+        api_class = self.api_class
+        if isinstance(api_class, str):
+            api_class = import_object(api_class)
+        self.api_client = api_class(user_id, api_key, **api_options)
         self.service_factory = ServiceFactory(self.api_client)
+        self._operations = {}
+
+    def close(self):
+        """
+        Closes the underlying API client and its connection pool.
+        """
+        self.api_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_operation_mapping(self):
         """
@@ -13,40 +43,99 @@ class Topvisor:
         Key: operation name.
         Value: tuple (service, method).
         """
-        return {
-            "get_projects": ("projects", "get_projects"),
-            "get_competitors": ("projects", "get_competitors"),
-            "get_positions_history": ("positions", "get_positions_history"),
-            "get_positions_summary": ("positions", "get_positions_summary"),
-            "get_positions_summary_chart": ("positions", "get_positions_summary_chart"),
-            "get_searchers_regions": ("positions", "get_searchers_regions"),
-            "get_snapshots_history": ("snapshots", "get_snapshots_history"),
-        }
+        return self.operation_mapping
 
-    def run_task(self, task_name, fetch_all=False, limit=10000, **kwargs):
+    def get_operation(self, task_name):
         """
-        Universal method for executing operations.
+        Resolves an operation name to the bound service method.
         :param task_name: Operation name.
-        :param fetch_all: If True, fetch all paginated data (default: False).
-        :param limit: Number of items per request if fetch_all=True (default: 10000).
-        :param kwargs: Arguments for the operation.
-        :return: Operation execution result (single response or all paginated data).
+        :return: Service method implementing the operation.
         """
+        method = self._operations.get(task_name)
+        if method is not None:
+            return method
 
-        operation_mapping = self.get_operation_mapping()
-
-        if task_name not in operation_mapping:
+        if task_name not in self.operation_mapping:
             raise ValueError(f"Unknown operation: {task_name}")
 
-        service_name, method_name = operation_mapping[task_name]
+        service_name, method_name = self.operation_mapping[task_name]
         service = self.service_factory.get_service(service_name)
 
         method = getattr(service, method_name, None)
+        if method is None:
+            # Registered endpoint without a dedicated service method
+            def method(**kwargs):
+                return service.call(task_name, kwargs, kwargs)
 
-        if not method:
-            raise AttributeError(
-                f"Method {method_name} not found in service {service_name}"
-            )
+        self._operations[task_name] = method
+        return method
+
+    def run_task(self, task_name, fetch_all=False, limit=10000, stream=False, **kwargs):
+        """
+        Universal method for executing operations.
+        :param task_name: Operation name.
+        :param fetch_all: If True, fetch all paginated data (default: False).
+        :param limit: Number of items per request if fetch_all=True or stream=True (default: 10000).
+        :param stream: If True, return an iterator over records of all pages (default: False).
+        :param kwargs: Arguments for the operation.
+        :return: Operation execution result (single response, all paginated data
+            or an iterator of records).
+        """
+        method = self.get_operation(task_name)
         kwargs["fetch_all"] = fetch_all
         kwargs["limit"] = limit
-        return method(**kwargs)
\ No newline at end of file
+        kwargs["stream"] = stream
+        return method(**kwargs)
+
+    def _run_spec(self, spec):
+        kwargs = dict(spec)
+        task_name = kwargs.pop("task")
+        try:
+            return TaskResult(spec, self.run_task(task_name, **kwargs), None)
+        except Exception as e:
+            return TaskResult(spec, None, e)
+
+    def run_tasks(self, specs, max_workers=8, stream=False):
+        """
+        Runs many operations concurrently through a shared worker pool.
+        :param specs: Iterable of task specs: {"task": operation name, **operation arguments}.
+        :param max_workers: Maximum number of operations running at once (default: 8).
+        :param stream: If True, yield results as they complete instead of returning a list.
+        :return: List of TaskResult(spec, result, error) in spec order,
+            or a generator of TaskResult in completion order if stream=True.
+        """
+        specs = [normalize_task_spec(spec) for spec in specs]
+        if stream:
+            return self._iter_tasks(specs, max_workers)
+        if not specs:
+            return []
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(specs)))) as executor:
+            return list(executor.map(self._run_spec, specs))
+
+    def _iter_tasks(self, specs, max_workers):
+        if not specs:
+            return
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(specs)))) as executor:
+            futures = [executor.submit(self._run_spec, spec) for spec in specs]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def map_task(self, task_name, grid, max_workers=8, stream=False, **kwargs):
+        """
+        Runs one operation for every combination of the grid values.
+        :param task_name: Operation name.
+        :param grid: Mapping of argument name to values, e.g. {"project_id": [1, 2], "region_index": [1, 2]}.
+        :param max_workers: Maximum number of operations running at once (default: 8).
+        :param stream: If True, yield results as they complete.
+        :param kwargs: Arguments shared by all runs.
+        :return: Same as run_tasks.
+        """
+        return self.run_tasks(expand_grid(task_name, grid, **kwargs), max_workers=max_workers, stream=stream)
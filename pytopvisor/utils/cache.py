@@ -0,0 +1,182 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def make_cache_key(endpoint: str, payload: Optional[Dict[str, Any]], scope: str = "") -> str:
+    """
+    Builds a cache key from an account scope, an endpoint and a canonical form of the payload.
+    """
+    canonical = json.dumps(payload or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return f"{scope}|{endpoint}|{canonical}"
+
+
+class MemoryCacheBackend:
+    """
+    In-memory LRU cache backend with per-entry expiration.
+
+    Values are stored and returned as is, so cached responses must not be modified by callers.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        :param maxsize: Maximum number of cached responses (default: 1024).
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteCacheBackend:
+    """
+    Persistent cache backend storing JSON-encoded responses in an SQLite file.
+    """
+
+    def __init__(self, path: str = "pytopvisor_cache.sqlite3"):
+        """
+        :param path: Path to the SQLite database file (default: pytopvisor_cache.sqlite3).
+        """
+        import sqlite3
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, value TEXT)"
+            )
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, value = row
+            if expires_at < time.time():
+                with self._connection:
+                    self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, encoded),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Response cache placed in front of TopvisorAPI.send_request.
+
+    Entries are keyed by account scope, endpoint and canonical payload, so clients of
+    different accounts can share one cache. TTL can be set per endpoint.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        ttl_by_endpoint: Optional[Dict[str, float]] = None,
+        maxsize: int = 1024,
+        backend=None,
+    ):
+        """
+        :param ttl: Default time to live in seconds (default: 60).
+        :param ttl_by_endpoint: TTL overrides by endpoint path; 0 disables caching for the endpoint.
+        :param maxsize: Maximum number of entries of the default in-memory backend (default: 1024).
+        :param backend: Storage backend (default: MemoryCacheBackend(maxsize)).
+        """
+        self.ttl = ttl
+        self.ttl_by_endpoint = dict(ttl_by_endpoint or {})
+        self.backend = backend if backend is not None else MemoryCacheBackend(maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get_ttl(self, endpoint: str) -> float:
+        return self.ttl_by_endpoint.get(endpoint, self.ttl)
+
+    def get(self, endpoint: str, payload: Optional[Dict[str, Any]], scope: str = "") -> Any:
+        """
+        Returns a cached response or None on a miss.
+        :param scope: Account the response belongs to (TopvisorAPI passes its cache_scope).
+        """
+        if self.get_ttl(endpoint) <= 0:
+            return None
+        value = self.backend.get(make_cache_key(endpoint, payload, scope))
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, endpoint: str, payload: Optional[Dict[str, Any]], value: Any, scope: str = "") -> None:
+        ttl = self.get_ttl(endpoint)
+        if ttl > 0:
+            self.backend.set(make_cache_key(endpoint, payload, scope), value, ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns hit/miss statistics.
+        """
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": len(self.backend),
+        }
@@ -0,0 +1,79 @@
+import threading
+import time
+from pytopvisor.utils.exceptions import CircuitOpenError
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the API transport.
+
+    After `failure_threshold` consecutive failures the circuit opens and every
+    request fails fast with CircuitOpenError for `recovery_timeout` seconds.
+    Then a single trial request is let through: success closes the circuit,
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        :param failure_threshold: Consecutive failures that open the circuit (default: 5).
+        :param recovery_timeout: Seconds to fail fast before a trial request (default: 30).
+        """
+        if failure_threshold < 1:
+            raise ValueError("'failure_threshold' must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._cool_down_left() <= 0:
+                return self.HALF_OPEN
+            return self._state
+
+    def _cool_down_left(self) -> float:
+        return self._opened_at + self.recovery_timeout - time.monotonic()
+
+    def before_request(self) -> None:
+        """
+        Raises CircuitOpenError if requests are not allowed right now.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN:
+                left = self._cool_down_left()
+                if left > 0:
+                    raise CircuitOpenError(f"Circuit is open, retry in {left:.1f}s")
+                # Let a single trial request through
+                self._state = self.HALF_OPEN
+                return
+            raise CircuitOpenError("Circuit is half-open, a trial request is in progress")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def release(self) -> None:
+        """
+        Frees the trial slot of a request that ended without a result (e.g. it was cancelled).
+        The circuit stays open, and the next request becomes the new trial.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,94 @@
+import codecs
+import csv
+from collections import namedtuple
+from typing import Any, Iterable, Iterator, List
+
+
+class CsvStreamParser:
+    """
+    Incremental parser for CSV exports returned by the API.
+
+    Accepts the response body in arbitrary byte chunks, decodes it incrementally
+    and returns complete rows as soon as they are available. Quoted fields may
+    contain delimiters and line breaks.
+    """
+
+    def __init__(self, delimiter: str = ";", encoding: str = "cp1251", typed: bool = False):
+        """
+        :param delimiter: Field delimiter (default ';').
+        :param encoding: Body encoding (default 'cp1251').
+        :param typed: If True, the first row is a header and rows are returned as namedtuples.
+        """
+        self.delimiter = delimiter
+        self.typed = typed
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._tail = ""
+        self._record = ""
+        self._quotes = 0
+        self._row_class = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Consumes a chunk of the body and returns the rows completed by it.
+        """
+        text = self._tail + self._decoder.decode(chunk)
+        lines = text.split("\n")
+        self._tail = lines.pop()
+        return self._parse_lines(lines)
+
+    def close(self) -> List[Any]:
+        """
+        Flushes the decoder and returns the remaining rows.
+        """
+        text = self._tail + self._decoder.decode(b"", final=True)
+        self._tail = ""
+        lines = [text] if text else []
+        rows = self._parse_lines(lines)
+        if self._record:
+            # Unterminated quoted field: let the csv module report what it can
+            rows.extend(self._build_rows([self._record]))
+            self._record = ""
+        return rows
+
+    def _parse_lines(self, lines: List[str]) -> List[Any]:
+        records = []
+        for line in lines:
+            self._record += line + "\n"
+            self._quotes += line.count('"')
+            # An odd number of quotes means a quoted field continues on the next line
+            if self._quotes % 2 == 0:
+                if self._record.strip():
+                    records.append(self._record)
+                self._record = ""
+                self._quotes = 0
+        return self._build_rows(records) if records else []
+
+    def _build_rows(self, records: List[str]) -> List[Any]:
+        rows = list(csv.reader(records, delimiter=self.delimiter))
+        if not self.typed:
+            return rows
+        if self._row_class is None and rows:
+            self._row_class = namedtuple("Row", [name.strip() for name in rows.pop(0)], rename=True)
+        return [self._make_row(row) for row in rows]
+
+    def _make_row(self, row: List[str]):
+        size = len(self._row_class._fields)
+        row = (row + [""] * size)[:size]
+        return self._row_class(*row)
+
+
+def iter_csv_rows(
+    chunks: Iterable[bytes], delimiter: str = ";", encoding: str = "cp1251", typed: bool = False
+) -> Iterator[Any]:
+    """
+    Parses CSV rows from an iterable of byte chunks.
+    :param chunks: Body chunks, e.g. response.iter_content().
+    :param delimiter: Field delimiter (default ';').
+    :param encoding: Body encoding (default 'cp1251').
+    :param typed: If True, the first row is a header and rows are returned as namedtuples.
+    :return: Generator of rows.
+    """
+    parser = CsvStreamParser(delimiter=delimiter, encoding=encoding, typed=typed)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -0,0 +1,26 @@
+from datetime import date, timedelta
+from typing import List, Tuple
+
+
+def split_date_range(date1: str, date2: str, window_days: int) -> List[Tuple[str, str]]:
+    """
+    Splits a period into consecutive windows of at most `window_days` days.
+    :param date1: Start date of the period (YYYY-MM-DD).
+    :param date2: End date of the period (YYYY-MM-DD).
+    :param window_days: Maximum length of a window in days.
+    :return: List of (date1, date2) pairs covering the period in order.
+    """
+    if window_days < 1:
+        raise ValueError("'window_days' must be at least 1")
+    start = date.fromisoformat(date1)
+    end = date.fromisoformat(date2)
+    if start > end:
+        start, end = end, start
+
+    windows = []
+    step = timedelta(days=window_days - 1)
+    while start <= end:
+        window_end = min(start + step, end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end + timedelta(days=1)
+    return windows
@@ -40,3 +40,11 @@ ERROR_MAPPING = {
     2004: InvalidRequestError,
     2005: InvalidRequestError,
 }
+
+# Exceptions from ERROR_MAPPING that signal a transient condition worth retrying
+RETRYABLE_ERRORS = (RateLimitError, ServerError)
+
+
+class CircuitOpenError(TopvisorAPIError):
+    """Exception raised without a request while the circuit breaker is open."""
+    pass
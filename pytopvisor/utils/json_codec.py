@@ -0,0 +1,80 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class JSONCodec(ABC):
+    """
+    Encodes request payloads and decodes response bodies.
+
+    Works on bytes in both directions so responses are decoded straight from the
+    raw body without building an intermediate str.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Decodes a response body.
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes a request payload.
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    Codec based on the standard json module.
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec based on orjson (pip install pytopvisor[fast]).
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+def get_json_codec(codec="auto") -> JSONCodec:
+    """
+    Resolves a JSON codec.
+    :param codec: JSONCodec instance, "json", "orjson" or "auto"
+        (orjson if installed, otherwise the standard library).
+    :return: JSONCodec instance.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "json":
+        return StdlibJSONCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "auto":
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StdlibJSONCodec()
+    raise ValueError(f"Unknown JSON codec: {codec}")
@@ -0,0 +1,144 @@
+import codecs
+import json
+from typing import Any, List, Sequence
+
+_WHITESPACE = " \t\n\r"
+# Characters that may follow a complete array item
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+class JsonRecordStreamParser:
+    """
+    Incremental parser yielding the items of one array inside a JSON document.
+
+    The document is fed in byte chunks. Text before the target array is scanned
+    to locate it; each array item is decoded as soon as it is complete and then
+    discarded, so memory is bounded by roughly one item. Everything outside the
+    array is kept and parsed at the end as `envelope` (with the array emptied),
+    which gives access to headers, totals and errors.
+    """
+
+    def __init__(self, path: Sequence[str] = ("result", "keywords")):
+        """
+        :param path: Keys leading from the top-level object to the array (default: result.keywords).
+        """
+        self.path = list(path)
+        self.envelope = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._state = "prefix"
+        self._prefix = ""
+        self._suffix = []
+        self._buffer = ""
+        # Prefix scanner state
+        self._pos = 0
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string = None
+        self._pending_key = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Consumes a chunk of the body and returns the array items completed by it.
+        """
+        return self._feed_text(self._decoder.decode(chunk))
+
+    def close(self) -> List[Any]:
+        """
+        Finishes parsing, sets `envelope` and returns the remaining items.
+        """
+        items = self._feed_text(self._decoder.decode(b"", final=True))
+        if self._state == "items":
+            # The body ended inside the array: decode strictly to surface the error
+            items.extend(self._decode_items(final=True))
+        if self._state == "prefix":
+            self.envelope = json.loads(self._prefix) if self._prefix.strip() else None
+        else:
+            self.envelope = json.loads(self._prefix + "[" + "".join(self._suffix))
+        return items
+
+    def _feed_text(self, text: str) -> List[Any]:
+        if not text:
+            return []
+        if self._state == "suffix":
+            self._suffix.append(text)
+            return []
+        if self._state == "items":
+            self._buffer += text
+            return self._decode_items()
+
+        self._prefix += text
+        index = self._scan_prefix()
+        if index is None:
+            return []
+        # The array starts right before index: split the prefix off
+        self._buffer = self._prefix[index:]
+        self._prefix = self._prefix[:index - 1]
+        self._state = "items"
+        return self._decode_items()
+
+    def _scan_prefix(self):
+        """
+        Scans the prefix for the target array and returns the index right after its '['.
+        """
+        text = self._prefix
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start:i + 1]
+            elif char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":":
+                self._pending_key = json.loads(self._last_string)
+            elif char in "{[":
+                if char == "[" and self._stack[1:] + [self._pending_key] == self.path and self._stack:
+                    self._pos = i + 1
+                    return i + 1
+                self._stack.append(self._pending_key)
+                self._pending_key = None
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+            elif char == ",":
+                self._pending_key = None
+        self._pos = len(text)
+        return None
+
+    def _decode_items(self, final: bool = False) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        index = 0
+        length = len(buffer)
+        while True:
+            while index < length and (buffer[index] in _WHITESPACE or buffer[index] == ","):
+                index += 1
+            if index >= length:
+                break
+            if buffer[index] == "]":
+                self._state = "suffix"
+                self._suffix.append(buffer[index:])
+                self._buffer = ""
+                return items
+            try:
+                item, end = self._json_decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # The item is not complete yet, wait for more data
+                break
+            if not final and (end == length or buffer[end] not in _DELIMITERS):
+                # A number may continue in the next chunk ("12" + "34", "1." + "5"): wait for a delimiter
+                break
+            items.append(item)
+            index = end
+        self._buffer = buffer[index:]
+        return items
@@ -1,50 +1,141 @@
+import atexit
 import logging
-from pathlib import Path
+import threading
+
+LOGGER_NAME = "TopvisorLogger"
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+def configure_logging(
+    level=logging.INFO,
+    handlers=None,
+    log_file=None,
+    console=True,
+    fmt=LOG_FORMAT,
+    use_queue=True,
+):
+    """
+    Configures the library logger. May be called again to replace the configuration.
+
+    Until this is called the library only adds a NullHandler and records
+    propagate to the application's handlers (e.g. set up by logging.basicConfig).
+
+    With use_queue=True the logger only puts records on an in-memory queue;
+    the handlers run in a background QueueListener thread, so slow consoles or
+    disks never block request workers.
+
+    :param level: Minimum level of emitted records (default: INFO).
+    :param handlers: Handlers to use instead of the default console/file ones.
+    :param log_file: Also write ERROR and above to this file (default: no file).
+    :param console: Write records to stderr (default: True; ignored if handlers are given).
+    :param fmt: Format of the default handlers.
+    :param use_queue: Dispatch records through a QueueHandler (default: True).
+    :return: The configured logging.Logger.
+    """
+    return Logger().configure(
+        level=level, handlers=handlers, log_file=log_file, console=console, fmt=fmt, use_queue=use_queue
+    )
 
 
 class Logger:
     _instance = None
+    _lock = threading.RLock()
 
-    def __new__(cls, log_file="app.log"):
+    def __new__(cls, log_file=None):
         if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-            cls._instance._setup_logger(log_file)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(Logger, cls).__new__(cls)
+                    instance.logger = logging.getLogger(LOGGER_NAME)
+                    instance.listener = None
+                    instance.configured = False
+                    cls._instance = instance
         return cls._instance
 
-    def _setup_logger(self, log_file):
+    def configure(self, level=logging.INFO, handlers=None, log_file=None, console=True, fmt=LOG_FORMAT,
+                  use_queue=True):
+        """
+        Logger setup. See configure_logging.
+        """
+        with self._lock:
+            return self._configure(level, handlers, log_file, console, fmt, use_queue)
+
+    def _configure(self, level, handlers, log_file, console, fmt, use_queue):
+        from logging.handlers import QueueHandler, QueueListener
+
+        self._stop_listener()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+        if handlers is None:
+            formatter = logging.Formatter(fmt)
+            handlers = []
+            if log_file is not None:
+                file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
+                file_handler.setLevel(logging.ERROR)
+                file_handler.setFormatter(formatter)
+                handlers.append(file_handler)
+            if console:
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(formatter)
+                handlers.append(console_handler)
+
+        self.logger.setLevel(level)
+        # Without handlers of its own the logger defers to the application's logging setup
+        self.logger.propagate = not handlers
+        if use_queue and handlers:
+            import queue
+
+            log_queue = queue.SimpleQueue()
+            self.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self.listener.start()
+            self.logger.addHandler(QueueHandler(log_queue))
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+        self.configured = True
+        return self.logger
+
+    def close(self):
         """
-        Logger setup.
+        Stops the background listener, flushing queued records.
         """
-        self.logger = logging.getLogger("TopvisorLogger")
-        self.logger.setLevel(logging.DEBUG)
-
-        # Create logs directory if it doesn't exist
-        logs_dir = Path(__file__).resolve().parent.parent / "logs"
-        logs_dir.mkdir(exist_ok=True)
-
-        # Log format
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-
-        # File logging
-        api_error_handler = logging.FileHandler(
-            logs_dir / "api_errors.log", encoding="utf-8"
-        )
-        api_error_handler.setLevel(logging.ERROR)
-        api_error_handler.setFormatter(formatter)
-        self.logger.addHandler(api_error_handler)
-
-        # Console logging
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        with self._lock:
+            self._stop_listener()
+
+    def _stop_listener(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
 
     def get_logger(self):
         """
-        Returns the logger instance.
+        Returns the logger instance. On first use a NullHandler is added, as
+        libraries should: records still propagate to the application's handlers.
         """
+        if not self.configured:
+            with self._lock:
+                if not self.configured:
+                    if not self.logger.handlers:
+                        self.logger.addHandler(logging.NullHandler())
+                    self.configured = True
         return self.logger
 
 
-logger = Logger().get_logger()
+class LazyLogger:
+    """
+    Module-level logger proxy that sets up the logger on first use instead of at import time.
+    """
+
+    def __getattr__(self, name):
+        return getattr(Logger().get_logger(), name)
+
+
+@atexit.register
+def _stop_listener():
+    if Logger._instance is not None:
+        Logger._instance.close()
+
 
+logger = LazyLogger()
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List
+
+
+def _merge_unique(target: List[Any], values: List[Any]) -> None:
+    seen = set(map(repr, target))
+    for value in values:
+        key = repr(value)
+        if key not in seen:
+            seen.add(key)
+            target.append(value)
+
+
+def merge_positions_history(responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merges get/positions_2/history responses fetched for consecutive date windows.
+
+    Keywords are matched by ID (or name) and their positionsData series are combined;
+    header dates and existsDates are concatenated without duplicates.
+    :param responses: Responses in chronological order.
+    :return: Response with the same structure covering the whole period.
+    """
+    if not responses:
+        return {"result": {}}
+
+    merged = {k: v for k, v in responses[0].items() if k != "result"}
+    result = {}
+    keywords = {}
+
+    for response in responses:
+        window = response.get("result") or {}
+        for key, value in window.items():
+            if key == "keywords":
+                continue
+            if key == "headers":
+                headers = result.setdefault("headers", {})
+                for header, header_value in value.items():
+                    if header == "dates" and header in headers:
+                        _merge_unique(headers["dates"], header_value)
+                    else:
+                        headers.setdefault(header, list(header_value) if isinstance(header_value, list) else header_value)
+            elif key == "existsDates" and key in result:
+                _merge_unique(result[key], value)
+            elif key not in result:
+                result[key] = list(value) if isinstance(value, list) else value
+
+        for keyword in window.get("keywords", []):
+            keyword_key = keyword.get("id", keyword.get("name"))
+            known = keywords.get(keyword_key)
+            if known is None:
+                keyword = dict(keyword)
+                keyword["positionsData"] = dict(keyword.get("positionsData") or {})
+                keywords[keyword_key] = keyword
+            else:
+                known["positionsData"].update(keyword.get("positionsData") or {})
+
+    if "existsDates" in result:
+        result["existsDates"].sort()
+    result["keywords"] = list(keywords.values())
+    merged["result"] = result
+    return merged
@@ -0,0 +1,308 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+# Upper bounds of latency histogram buckets, in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+
+class RequestEvent:
+    """
+    Measurements of one API request, passed to the client's hooks when it completes.
+
+    Timings are in seconds. Timings and response sizes describe the last attempt,
+    except total_time, which spans all attempts including retry delays. The transport does not
+    expose connection setup separately, so time_to_headers covers waiting for
+    a connection slot on the pool, connecting, sending the payload and waiting
+    for the response headers. For streamed responses transfer_time is the time
+    spent reading the body, and parsing happens while records are consumed.
+    response_bytes counts the decoded body, wire_bytes the bytes received before
+    content decoding (smaller when the response was compressed).
+    """
+
+    __slots__ = (
+        "endpoint",
+        "offset",
+        "limit",
+        "payload_bytes",
+        "response_bytes",
+        "wire_bytes",
+        "status_code",
+        "retries",
+        "time_to_headers",
+        "transfer_time",
+        "parse_time",
+        "total_time",
+        "error",
+        "started",
+    )
+
+    def __init__(self, endpoint: str, payload: Optional[Dict[str, Any]] = None):
+        payload = payload or {}
+        self.endpoint = endpoint
+        self.offset = payload.get("offset")
+        self.limit = payload.get("limit")
+        self.payload_bytes = 0
+        self.response_bytes = 0
+        self.wire_bytes = 0
+        self.status_code = None
+        self.retries = 0
+        self.time_to_headers = 0.0
+        self.transfer_time = 0.0
+        self.parse_time = 0.0
+        self.total_time = 0.0
+        self.error = None
+        self.started = time.perf_counter()
+
+    def start_attempt(self) -> None:
+        """
+        Resets the measurements that describe a single attempt, before the request is sent again.
+        """
+        self.response_bytes = 0
+        self.wire_bytes = 0
+        self.time_to_headers = 0.0
+        self.transfer_time = 0.0
+        self.parse_time = 0.0
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """
+        Records the total time and the class name of the error the request failed with.
+        """
+        self.total_time = time.perf_counter() - self.started
+        self.error = type(error).__name__ if error is not None else None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "started"}
+
+    def __repr__(self):
+        return (
+            f"RequestEvent({self.endpoint!r}, offset={self.offset}, "
+            f"total_time={self.total_time:.3f}, error={self.error})"
+        )
+
+
+def wire_bytes(response: Any, default: Optional[int] = None) -> Optional[int]:
+    """
+    Returns the number of body bytes received over the wire, before content decoding.
+
+    Works with requests (urllib3) and httpx responses and with transports that set
+    a wire_bytes attribute; returns default if the response does not expose it.
+    """
+    value = getattr(response, "wire_bytes", None)
+    if value is None:
+        value = getattr(response, "num_bytes_downloaded", None)
+    if value is None:
+        tell = getattr(getattr(response, "raw", None), "tell", None)
+        if tell is not None:
+            try:
+                value = tell()
+            except (OSError, ValueError):
+                value = None
+    return default if value is None else value
+
+
+def track_chunks(chunks: Iterable[bytes], event: Optional[RequestEvent], response: Any = None) -> Iterable[bytes]:
+    """
+    Adds the size and read time of streamed body chunks to the event and, once the
+    stream ends, the bytes of the response received over the wire.
+    """
+    if event is None:
+        return chunks
+    return _track_chunks(chunks, event, response)
+
+
+def _track_chunks(chunks, event, response):
+    clock = time.perf_counter
+    iterator = iter(chunks)
+    received = 0
+    try:
+        while True:
+            started = clock()
+            chunk = next(iterator, None)
+            event.transfer_time += clock() - started
+            if chunk is None:
+                return
+            received += len(chunk)
+            event.response_bytes += len(chunk)
+            yield chunk
+    finally:
+        event.wire_bytes += wire_bytes(response, received)
+
+
+def atrack_chunks(chunks, event: Optional[RequestEvent], response: Any = None):
+    """
+    Async counterpart of track_chunks.
+    """
+    if event is None:
+        return chunks
+    return _atrack_chunks(chunks, event, response)
+
+
+async def _atrack_chunks(chunks, event, response):
+    clock = time.perf_counter
+    iterator = chunks.__aiter__()
+    received = 0
+    try:
+        while True:
+            started = clock()
+            try:
+                chunk = await iterator.__anext__()
+            except StopAsyncIteration:
+                event.transfer_time += clock() - started
+                return
+            event.transfer_time += clock() - started
+            received += len(chunk)
+            event.response_bytes += len(chunk)
+            yield chunk
+    finally:
+        event.wire_bytes += wire_bytes(response, received)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram in the style of Prometheus.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a quantile as the upper bound of the bucket containing it
+        (infinity if it falls beyond the last bucket).
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = []
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            cumulative.append((bound, seen))
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": cumulative,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class EndpointMetrics:
+    """
+    Counters and latency histograms of one endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.requests = 0
+        self.errors: Dict[str, int] = {}
+        self.retries = 0
+        self.payload_bytes = 0
+        self.response_bytes = 0
+        self.wire_bytes = 0
+        self.latency = Histogram(buckets)
+        self.time_to_headers = Histogram(buckets)
+        self.transfer_time = Histogram(buckets)
+        self.parse_time = Histogram(buckets)
+
+    def add(self, event: RequestEvent) -> None:
+        self.requests += 1
+        if event.error is not None:
+            self.errors[event.error] = self.errors.get(event.error, 0) + 1
+        self.retries += event.retries
+        self.payload_bytes += event.payload_bytes
+        self.response_bytes += event.response_bytes
+        self.wire_bytes += event.wire_bytes
+        self.latency.observe(event.total_time)
+        self.time_to_headers.observe(event.time_to_headers)
+        self.transfer_time.observe(event.transfer_time)
+        self.parse_time.observe(event.parse_time)
+
+    def snapshot(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "payload_bytes": self.payload_bytes,
+            "response_bytes": self.response_bytes,
+            "wire_bytes": self.wire_bytes,
+            # Decoded bytes per byte on the wire; above 1 when responses were compressed
+            "compression_ratio": self.response_bytes / self.wire_bytes if self.wire_bytes else None,
+            "requests_per_second": self.requests / elapsed if elapsed else 0.0,
+            "response_bytes_per_second": self.response_bytes / elapsed if elapsed else 0.0,
+            "wire_bytes_per_second": self.wire_bytes / elapsed if elapsed else 0.0,
+            "latency": self.latency.snapshot(),
+            "time_to_headers": self.time_to_headers.snapshot(),
+            "transfer_time": self.transfer_time.snapshot(),
+            "parse_time": self.parse_time.snapshot(),
+        }
+
+
+class MetricsCollector:
+    """
+    Request hook aggregating counters and latency histograms per endpoint.
+
+    Example: metrics = MetricsCollector(); Topvisor(user_id, api_key, hooks=[metrics]);
+    metrics.snapshot() then returns plain dicts that can be logged, dumped as
+    JSON or converted for a metrics backend.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        :param buckets: Upper bounds of latency histogram buckets, in seconds.
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoints.get(event.endpoint)
+            if metrics is None:
+                metrics = self._endpoints[event.endpoint] = EndpointMetrics(self.buckets)
+            metrics.add(event)
+
+    def reset(self) -> None:
+        """
+        Drops all collected data and restarts the throughput clock.
+        """
+        with self._lock:
+            self._endpoints: Dict[str, EndpointMetrics] = {}
+            self._started = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns collected metrics: {"elapsed": seconds, "endpoints": {endpoint: {...}}}.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._started
+            return {
+                "elapsed": elapsed,
+                "endpoints": {
+                    endpoint: metrics.snapshot(elapsed) for endpoint, metrics in self._endpoints.items()
+                },
+            }
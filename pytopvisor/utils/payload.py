@@ -1,43 +1,235 @@
-from typing import List, Any, Optional, Dict, Callable
-from functools import wraps
-
-
-def add_universal_params(func: Callable) -> Callable:
-    """Decorator to add universal parameters to the payload."""
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Dict[str, Any]:
-        kwargs = {k: v for k, v in kwargs.items() if k != 'self'}
-        payload = func(*args, **kwargs)
-        universal_params = {
-            "limit": int,
-            "offset": int,
-            "fields": list,
-            "filters": List[dict],  # Оставляем как аннотацию, но не для isinstance
-            "id": int,
-            "orders": list,
-        }
-        for param, param_type in universal_params.items():
-            if param in kwargs and kwargs[param] is not None:
-                if param == "filters":
-                    # Специальная проверка для filters как списка словарей
-                    if not isinstance(kwargs[param], list) or not all(isinstance(f, dict) for f in kwargs[param]):
-                        raise ValueError(f"'{param}' must be a list of dictionaries")
-                elif not isinstance(kwargs[param], param_type):
-                    raise ValueError(f"Param '{param}' must be {param_type.__name__}")
-                payload[param] = kwargs[param]
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class PayloadField:
+    """
+    Declares how a method parameter is written to the request payload.
+    """
+
+    __slots__ = ("name", "key", "coerce", "default", "keep_none")
+
+    def __init__(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        coerce: Optional[Callable[[Any], Any]] = None,
+        default: Any = None,
+        keep_none: bool = False,
+    ):
+        """
+        :param name: Parameter name.
+        :param key: Payload key (default: same as name).
+        :param coerce: Conversion applied to non-None values, e.g. int for booleans.
+        :param default: Value used when the parameter is not passed at all.
+        :param keep_none: Write the key even if the value is None.
+        """
+        self.name = name
+        self.key = key or name
+        self.coerce = coerce
+        self.default = default
+        self.keep_none = keep_none
+
+
+def _check_list_of_dicts(name: str, value: Any) -> None:
+    if not isinstance(value, list) or not all(isinstance(f, dict) for f in value):
+        raise ValueError(f"'{name}' must be a list of dictionaries")
+
+
+def _type_check(param_type: type) -> Callable[[str, Any], None]:
+    def check(name: str, value: Any) -> None:
+        if not isinstance(value, param_type):
+            raise ValueError(f"Param '{name}' must be {param_type.__name__}")
+
+    return check
+
+
+# Parameters supported by every API method
+UNIVERSAL_PARAMS: Tuple[Tuple[str, Callable[[str, Any], None]], ...] = (
+    ("limit", _type_check(int)),
+    ("offset", _type_check(int)),
+    ("fields", _type_check(list)),
+    ("filters", _check_list_of_dicts),
+    ("id", _type_check(int)),
+    ("orders", _type_check(list)),
+)
+
+
+class PayloadSchema:
+    """
+    Payload builder compiled from a list of PayloadField declarations.
+
+    The build plan is prepared once, so building a payload only walks the
+    declared fields and writes the keys that are actually set.
+    """
+
+    def __init__(self, *fields: PayloadField):
+        self.fields = fields
+        self._plan = tuple(
+            (field.name, field.key, field.coerce, field.default, field.keep_none) for field in fields
+        )
+
+    def build(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds the payload from a dict of parameters (e.g. a method's locals()).
+        """
+        payload = {}
+        get = params.get
+        for name, key, coerce, default, keep_none in self._plan:
+            value = get(name, default)
+            if value is None:
+                if keep_none:
+                    payload[key] = None
+                continue
+            payload[key] = value if coerce is None else coerce(value)
+        for name, check in UNIVERSAL_PARAMS:
+            value = get(name)
+            if value is not None:
+                check(name, value)
+                payload[name] = value
+        return payload
+
+    def template(self, **fixed) -> "PayloadTemplate":
+        """
+        Pre-builds the fixed part of a payload for reuse across many requests.
+        :param fixed: Parameters shared by all payloads built from the template.
+        """
+        return PayloadTemplate(self, fixed)
+
+
+class PayloadTemplate:
+    """
+    Payload schema with some parameters bound in advance.
+
+    Example: template = PayloadFactory.template("positions_get_summary", region_index=1, dates=[...]);
+    then template.build(project_id=project_id) for each project.
+    """
+
+    def __init__(self, schema: PayloadSchema, fixed: Dict[str, Any]):
+        self.schema = schema
+        fixed_names = set(fixed)
+        self._base = PayloadSchema(*(f for f in schema.fields if f.name in fixed_names)).build(fixed)
+        self._rest = PayloadSchema(*(f for f in schema.fields if f.name not in fixed_names))
+
+    def build(self, **params) -> Dict[str, Any]:
+        payload = dict(self._base)
+        payload.update(self._rest.build(params))
         return payload
-    return wrapper
+
+
+PAYLOAD_SCHEMAS: Dict[str, PayloadSchema] = {
+    # get/projects_2/projects
+    "projects_get_projects": PayloadSchema(
+        PayloadField("show_site_stat"),
+        PayloadField("show_searchers_and_regions"),
+        PayloadField("include_positions_summary"),
+    ),
+    # get/projects_2/competitors
+    "projects_get_competitors": PayloadSchema(
+        PayloadField("project_id", keep_none=True),
+        PayloadField("only_enabled"),
+        PayloadField("include_project"),
+    ),
+    # get/positions_2/history
+    "positions_get_history": PayloadSchema(
+        PayloadField("project_id"),
+        PayloadField("regions_indexes"),
+        PayloadField("dates"),
+        PayloadField("date1"),
+        PayloadField("date2"),
+        PayloadField("competitors_ids"),
+        PayloadField("type_range", default=2),
+        PayloadField("count_dates"),
+        PayloadField("only_exists_first_date", coerce=int),
+        PayloadField("show_headers", coerce=int),
+        PayloadField("show_exists_dates", coerce=int),
+        PayloadField("show_visitors", coerce=int),
+        PayloadField("show_top_by_depth"),
+        PayloadField("positions_fields"),
+        PayloadField("filter_by_dynamic"),
+        PayloadField("filter_by_positions"),
+    ),
+    # get/positions_2/summary
+    "positions_get_summary": PayloadSchema(
+        PayloadField("project_id"),
+        PayloadField("region_index"),
+        PayloadField("dates"),
+        PayloadField("competitor_id"),
+        PayloadField("only_exists_first_date", coerce=int),
+        PayloadField("show_dynamics", coerce=int),
+        PayloadField("show_tops", coerce=int),
+        PayloadField("show_avg", coerce=int),
+        PayloadField("show_visibility", coerce=int),
+        PayloadField("show_median", coerce=int),
+    ),
+    # get/positions_2/summary/chart
+    "positions_get_summary_chart": PayloadSchema(
+        PayloadField("project_id"),
+        PayloadField("region_index"),
+        PayloadField("dates"),
+        PayloadField("date1"),
+        PayloadField("date2"),
+        PayloadField("competitors_ids"),
+        PayloadField("type_range", default=2),
+        PayloadField("only_exists_first_date", coerce=int),
+        PayloadField("show_tops", coerce=int),
+        PayloadField("show_avg", coerce=int),
+        PayloadField("show_visibility", coerce=int),
+    ),
+    # get/positions_2/searchers/regions/export
+    "positions_get_searchers_regions": PayloadSchema(
+        PayloadField("project_id"),
+        PayloadField("searcher_key"),
+        PayloadField("name_key", key="name/key"),
+        PayloadField("country_code"),
+        PayloadField("lang"),
+        PayloadField("device"),
+        PayloadField("depth"),
+    ),
+    # get/snapshots_2/history
+    "snapshots_get_history": PayloadSchema(
+        PayloadField("project_id"),
+        PayloadField("region_index"),
+        PayloadField("dates"),
+        PayloadField("date1"),
+        PayloadField("date2"),
+        PayloadField("type_range", default=2),
+        PayloadField("count_dates"),
+        PayloadField("show_exists_dates", coerce=int),
+        PayloadField("show_ams", coerce=int),
+        PayloadField("positions_fields"),
+    ),
+}
+
 
 class PayloadFactory:
 
     @staticmethod
-    @add_universal_params
+    def build(schema_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds a payload with a named schema from a dict of parameters.
+        :param schema_name: Key of PAYLOAD_SCHEMAS.
+        :param params: Method parameters (e.g. locals()).
+        :return: Payload for the request.
+        """
+        return PAYLOAD_SCHEMAS[schema_name].build(params)
+
+    @staticmethod
+    def template(schema_name: str, **fixed) -> PayloadTemplate:
+        """
+        Creates a reusable payload template with some parameters bound in advance.
+        :param schema_name: Key of PAYLOAD_SCHEMAS.
+        :param fixed: Parameters shared by all payloads built from the template.
+        :return: PayloadTemplate.
+        """
+        return PAYLOAD_SCHEMAS[schema_name].template(**fixed)
+
+    @staticmethod
     def projects_get_projects_payload(
         show_site_stat: Optional[bool] = None,
         show_searchers_and_regions: Optional[int] = None,
         include_positions_summary: Optional[bool] = None,
         **kwargs
-    ) -> Dict[str, Any] | None:
+    ) -> Dict[str, Any]:
         """
         Generates payload for the method get/projects_2/projects.
         :param show_site_stat: Add additional project information (boolean).
@@ -45,17 +237,9 @@ class PayloadFactory:
         :param include_positions_summary: Add a summary of positions (boolean).
         :return: Payload for the request.
         """
-        payload = {}
-        if show_site_stat is not None:
-            payload["show_site_stat"] = show_site_stat
-        if show_searchers_and_regions is not None:
-            payload["show_searchers_and_regions"] = show_searchers_and_regions
-        if include_positions_summary is not None:
-            payload["include_positions_summary"] = include_positions_summary
-        return payload
+        return PAYLOAD_SCHEMAS["projects_get_projects"].build({**kwargs, **locals()})
 
     @staticmethod
-    @add_universal_params
     def projects_get_competitors_payload(
         project_id: int,
         only_enabled: Optional[bool] = None,
@@ -69,15 +253,9 @@ class PayloadFactory:
         :param include_project: Include the project itself in the list (boolean).
         :return: Payload for the request.
         """
-        payload = {"project_id": project_id}
-        if only_enabled is not None:
-            payload["only_enabled"] = only_enabled
-        if include_project is not None:
-            payload["include_project"] = include_project
-        return payload
+        return PAYLOAD_SCHEMAS["projects_get_competitors"].build({**kwargs, **locals()})
 
     @staticmethod
-    @add_universal_params
     def positions_get_history_payload(
         project_id: int,
         regions_indexes: List[int],
@@ -118,29 +296,9 @@ class PayloadFactory:
         :param filter_by_positions: Filter by keyword positions.
         :return: Payload for the request.
         """
-        # Base payload structure
-        payload = {
-            "project_id": project_id,
-            "regions_indexes": regions_indexes,
-            "dates": dates,
-            "date1": date1,
-            "date2": date2,
-            "competitors_ids": competitors_ids,
-            "type_range": type_range,
-            "count_dates": count_dates,
-            "only_exists_first_date": int(only_exists_first_date) if only_exists_first_date is not None else None,
-            "show_headers": int(show_headers) if show_headers is not None else None,
-            "show_exists_dates": int(show_exists_dates) if show_exists_dates is not None else None,
-            "show_visitors": int(show_visitors) if show_visitors is not None else None,
-            "show_top_by_depth": show_top_by_depth,
-            "positions_fields": positions_fields,
-            "filter_by_dynamic": filter_by_dynamic,
-            "filter_by_positions": filter_by_positions,
-        }
-        return {k: v for k, v in payload.items() if v is not None}
+        return PAYLOAD_SCHEMAS["positions_get_history"].build({**kwargs, **locals()})
 
     @staticmethod
-    @add_universal_params
     def positions_get_summary_payload(
         project_id: int,
         region_index: int,
@@ -168,23 +326,9 @@ class PayloadFactory:
         :param show_median: Add median position (boolean).
         :return: Payload for the request.
         """
-        # Base payload structure
-        payload = {
-            "project_id": project_id,
-            "region_index": region_index,
-            "dates": dates,
-            "competitor_id": competitor_id,
-            "only_exists_first_date": int(only_exists_first_date) if only_exists_first_date is not None else None,
-            "show_dynamics": int(show_dynamics) if show_dynamics is not None else None,
-            "show_tops": int(show_tops) if show_tops is not None else None,
-            "show_avg": int(show_avg) if show_avg is not None else None,
-            "show_visibility": int(show_visibility) if show_visibility is not None else None,
-            "show_median": int(show_median) if show_median is not None else None,
-        }
-        return {k: v for k, v in payload.items() if v is not None}
+        return PAYLOAD_SCHEMAS["positions_get_summary"].build({**kwargs, **locals()})
 
     @staticmethod
-    @add_universal_params
     def positions_get_summary_chart_payload(
         project_id: int,
         region_index: int,
@@ -214,24 +358,9 @@ class PayloadFactory:
         :param show_visibility: Add visibility (boolean).
         :return: Payload for the request.
         """
-        payload = {
-            "project_id": project_id,
-            "region_index": region_index,
-            "dates": dates,
-            "date1": date1,
-            "date2": date2,
-            "competitors_ids": competitors_ids,
-            "type_range": type_range,
-            "only_exists_first_date": int(only_exists_first_date) if only_exists_first_date is not None else None,
-            "show_tops": int(show_tops) if show_tops is not None else None,
-            "show_avg": int(show_avg) if show_avg is not None else None,
-            "show_visibility": int(show_visibility) if show_visibility is not None else None,
-        }
-        return {k: v for k, v in payload.items() if v is not None}
-
+        return PAYLOAD_SCHEMAS["positions_get_summary_chart"].build({**kwargs, **locals()})
 
     @staticmethod
-    @add_universal_params
     def positions_get_searchers_regions_payload(
         project_id: int,
         searcher_key: Optional[int] = None,
@@ -253,21 +382,9 @@ class PayloadFactory:
         :param depth: Check depth.
         :return: Payload for the request.
         """
-        # Base payload structure
-        payload = {
-            "project_id": project_id,
-            "searcher_key": searcher_key,
-            "name/key": name_key,
-            "country_code": country_code,
-            "lang": lang,
-            "device": device,
-            "depth": depth,
-        }
-        return {k: v for k, v in payload.items() if v is not None}
-
+        return PAYLOAD_SCHEMAS["positions_get_searchers_regions"].build({**kwargs, **locals()})
 
     @staticmethod
-    @add_universal_params
     def snapshots_get_history_payload(
         project_id: int,
         region_index: int,
@@ -282,7 +399,7 @@ class PayloadFactory:
         **kwargs
     ) -> Dict[str, Any]:
         """
-        Generates payload for the method get/positions_2/history.
+        Generates payload for the method get/snapshots_2/history.
 
         :param project_id: Project ID.
         :param region_index: Region index.
@@ -296,18 +413,4 @@ class PayloadFactory:
         :param show_ams: Add to the result the storm index between the selected checks.
         :return: Payload for the request.
         """
-        # Base payload structure
-        payload = {
-            "project_id": project_id,
-            "region_index": region_index,
-            "dates": dates,
-            "date1": date1,
-            "date2": date2,
-            "type_range": type_range,
-            "count_dates": count_dates,
-            "show_exists_dates": int(show_exists_dates) if show_exists_dates is not None else None,
-            "show_ams": int(show_ams) if show_ams is not None else None,
-            "positions_fields": positions_fields,
-        }
-        return {k: v for k, v in payload.items() if v is not None}
-
+        return PAYLOAD_SCHEMAS["snapshots_get_history"].build({**kwargs, **locals()})
@@ -0,0 +1,57 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter.
+
+    Tokens are reserved under a short lock and the caller sleeps outside of it,
+    so one instance can be shared by threads and by asyncio tasks.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        """
+        :param rate: Allowed number of requests per second.
+        :param burst: Maximum number of requests sent back to back (default: max(1, rate)).
+        """
+        if rate <= 0:
+            raise ValueError("'rate' must be positive")
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst < 1:
+            raise ValueError("'burst' must be at least 1")
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Takes one token and returns how long the caller has to wait for it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Waits without blocking the event loop until a request may be sent.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            import asyncio
+
+            await asyncio.sleep(delay)
@@ -0,0 +1,90 @@
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional, Tuple, Type
+from pytopvisor.utils.exceptions import RETRYABLE_ERRORS
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff and full jitter.
+
+    Applied by the API client to every single request, so a failed page of
+    fetch_all is retried on its own without refetching the other pages.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = RETRYABLE_ERRORS,
+        retry_transport_errors: bool = True,
+        max_retry_after: float = 300.0,
+    ):
+        """
+        :param max_attempts: Total number of attempts including the first one (default: 3).
+        :param backoff_factor: Base delay in seconds, doubled on each attempt (default: 0.5).
+        :param max_backoff: Upper bound for a single delay in seconds (default: 30).
+        :param jitter: Randomize delays to spread out concurrent retries (default: True).
+        :param retry_on: API exception classes considered transient (default: RateLimitError, ServerError).
+        :param retry_transport_errors: Retry connection errors and timeouts (default: True).
+        :param max_retry_after: Upper bound for a delay requested by the server with Retry-After,
+            in seconds (default: 300); max_backoff does not apply to it.
+        """
+        if max_attempts < 1:
+            raise ValueError("'max_attempts' must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+        self.retry_transport_errors = retry_transport_errors
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, error: BaseException, attempt: int, transport_errors=()) -> bool:
+        """
+        Checks whether a failed attempt should be retried.
+        :param error: Exception raised by the attempt.
+        :param attempt: Number of the failed attempt (starting from 1).
+        :param transport_errors: Transport exception classes of the calling client.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if isinstance(error, self.retry_on):
+            return True
+        return self.retry_transport_errors and isinstance(error, tuple(transport_errors))
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns the delay before the next attempt.
+        :param attempt: Number of the failed attempt (starting from 1).
+        :param retry_after: Delay requested by the server; takes precedence if present and is
+            only capped by max_retry_after, since retrying earlier would fail again.
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_retry_after)
+        delay = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parses a Retry-After header given either in seconds or as an HTTP date.
+        """
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return (retry_at - datetime.now(timezone.utc)).total_seconds()
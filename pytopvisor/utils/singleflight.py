@@ -0,0 +1,91 @@
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single call.
+
+    The first caller runs the function; callers arriving while it is in
+    flight wait for it and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args):
+        """
+        Runs func(*args) unless a call with the same key is already in flight.
+        :param key: Coalescing key.
+        :param func: Function to call.
+        :return: Result of the (possibly shared) call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight. Must be used from a single event loop.
+
+    The shared call runs as its own task, so cancelling any caller, including
+    the first one, does not affect the others; the task is only cancelled when
+    every caller waiting for it has been cancelled.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, func, *args):
+        """
+        Awaits func(*args) unless a call with the same key is already in flight.
+        :param key: Coalescing key.
+        :param func: Coroutine function to call.
+        :return: Result of the (possibly shared) call.
+        """
+        import asyncio
+
+        call = self._calls.get(key)
+        if call is None:
+            call = _AsyncCall(asyncio.ensure_future(func(*args)))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._forget(key, call))
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                call.task.cancel()
+
+    def _forget(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,43 @@
+from collections import namedtuple
+from itertools import product
+from typing import Any, Dict, Iterable, List
+
+
+class TaskResult(namedtuple("TaskResult", ["spec", "result", "error"])):
+    """
+    Outcome of a single task run by Topvisor.run_tasks.
+
+    spec: the task spec ({"task": operation name, **operation arguments}).
+    result: operation result, or None if the task failed.
+    error: exception raised by the task, or None on success.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def normalize_task_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validates a task spec and returns it as a new dict.
+    """
+    if not isinstance(spec, dict) or "task" not in spec:
+        raise ValueError("Task spec must be a dict with a 'task' key")
+    return dict(spec)
+
+
+def expand_grid(task_name: str, grid: Dict[str, Iterable[Any]], **common) -> List[Dict[str, Any]]:
+    """
+    Builds task specs for every combination of the grid values.
+    :param task_name: Operation name.
+    :param grid: Mapping of argument name to the values to try, e.g. {"project_id": [1, 2]}.
+    :param common: Arguments shared by all specs.
+    :return: List of task specs.
+    """
+    names = list(grid)
+    return [
+        {"task": task_name, **common, **dict(zip(names, values))}
+        for values in product(*(list(grid[name]) for name in names))
+    ]
@@ -29,6 +29,7 @@ class ValidationRules:
             "positions_fields": List[str],
             "filter_by_dynamic": List[str],
             "filter_by_positions": List[List[int]],
+            "window_days": int,
             "dates_date1_exclusive": ("validate_mutually_exclusive", "dates", "date1"),
             "date1_date2_pair": ("validate_required_pair", "date1", "date2"),
         },
@@ -1,14 +1,31 @@
-from typing import Any, List, get_origin, get_args
-from datetime import datetime
+from typing import Any, Callable, Dict, List, get_origin, get_args
+from datetime import date
 from pytopvisor.utils.validation_rules import ValidationRules
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
+def is_valid_date(date_str: str) -> bool:
+    """Fast check of a YYYY-MM-DD date string."""
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+        return False
+    year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+    if not (year.isascii() and year.isdigit() and month.isdigit() and day.isdigit()):
+        return False
+    try:
+        date(int(year), int(month), int(day))
+    except ValueError:
+        return False
+    return True
+
+
 class Validator:
     """Flexible parameter validator for Topvisor API methods."""
 
+    # Validation functions compiled from ValidationRules, by method name
+    _compiled: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+
     @staticmethod
     def validate_type(value: Any, expected_type: Any, param_name: str) -> None:
         if value is None:
@@ -39,11 +56,7 @@ class Validator:
     def validate_date(date_str: str, param_name: str) -> None:
         if date_str is None:
             return
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            if len(date_str) != 10:
-                raise ValueError
-        except ValueError:
+        if not isinstance(date_str, str) or not is_valid_date(date_str):
             raise ValidationError(f"'{param_name}' must be in YYYY-MM-DD format")
 
     @staticmethod
@@ -51,8 +64,8 @@ class Validator:
         if dates is None:
             return
         Validator.validate_type(dates, List[str], param_name)
-        for date in dates:
-            Validator.validate_date(date, f"element of {param_name}")
+        for date_str in dates:
+            Validator.validate_date(date_str, f"element of {param_name}")
 
     @staticmethod
     def validate_enum(value: Any, allowed_values: List[Any], param_name: str) -> None:
@@ -72,40 +85,101 @@ class Validator:
     @classmethod
     def validate(cls, method_name: str, **kwargs) -> None:
         """Validates parameters based on predefined rules for the method."""
-        rules = ValidationRules.get_rules(method_name)
+        cls.compile(method_name)(kwargs)
+
+    @classmethod
+    def compile(cls, method_name: str) -> Callable[[Dict[str, Any]], None]:
+        """
+        Returns the validation function for the method, compiling its rules on first use.
+        The function takes a dict of parameters and raises ValidationError on invalid input.
+        """
+        compiled = cls._compiled.get(method_name)
+        if compiled is None:
+            compiled = cls._compile_rules(ValidationRules.get_rules(method_name))
+            cls._compiled[method_name] = compiled
+        return compiled
+
+    @classmethod
+    def _compile_rules(cls, rules: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+        checks = []
+        relations = []
 
-        # Проверка основных параметров
         for param_name, rule in rules.items():
             if param_name.endswith("_exclusive") or param_name.endswith("_pair"):
+                validator_name, param1, param2 = rule
+                if validator_name == "validate_mutually_exclusive":
+                    relations.append((cls.validate_mutually_exclusive, param1, param2))
+                elif validator_name == "validate_required_pair":
+                    relations.append((cls.validate_required_pair, param1, param2))
                 continue
-            value = kwargs.get(param_name)
             if isinstance(rule, tuple):
-                expected_type = rule[0]
-                cls.validate_type(value, expected_type, param_name)
-                if len(rule) > 1 and value is not None:
-                    if rule[1] == "validate_list_type":
-                        cls.validate_type(value, expected_type, param_name)  # Уже обработано в validate_type
-                    elif rule[1] == "validate_date":
-                        cls.validate_date(value, param_name)
-                    elif rule[1] == "validate_date_list":
-                        cls.validate_date_list(value, param_name)
-                    elif rule[1] == "validate_string_length":
-                        cls.validate_string_length(value, 2, param_name)
-                    elif rule[1].startswith("validate_enum"):
-                        allowed_values = rule[2]
-                        cls.validate_enum(value, allowed_values, param_name)
-                    else:
-                        raise ValueError(f"Unknown validator {rule[1]} for {param_name}")
+                checks.append((param_name, cls._compile_rule(rule, param_name)))
             else:
-                cls.validate_type(value, rule, param_name)
+                checks.append((param_name, cls._compile_type(rule, param_name)))
 
-        # Проверка взаимоисключений и пар
-        for param_name, rule in rules.items():
-            if param_name.endswith("_exclusive"):
-                validator_name, param1, param2 = rule
-                if validator_name == "validate_mutually_exclusive":
-                    cls.validate_mutually_exclusive(kwargs.get(param1), param1, kwargs.get(param2), param2)
-            elif param_name.endswith("_pair"):
-                validator_name, param1, param2 = rule
-                if validator_name == "validate_required_pair":
-                    cls.validate_required_pair(kwargs.get(param1), param1, kwargs.get(param2), param2)
\ No newline at end of file
+        def validate(params: Dict[str, Any]) -> None:
+            get = params.get
+            for param_name, check in checks:
+                value = get(param_name)
+                if value is not None:
+                    check(value)
+            for relation, param1, param2 in relations:
+                relation(get(param1), param1, get(param2), param2)
+
+        return validate
+
+    @classmethod
+    def _compile_type(cls, expected_type: Any, param_name: str) -> Callable[[Any], None]:
+        """Pre-resolves a (possibly generic) type into a check function."""
+        origin_type = get_origin(expected_type) or expected_type
+        if origin_type is list:
+            args = get_args(expected_type)
+            item_type = args[0] if args else Any
+            item_check = None
+            if item_type is not Any:
+                item_check = cls._compile_type(item_type, f"element of {param_name}")
+
+            def check_list(value):
+                if not isinstance(value, list):
+                    raise ValidationError(f"'{param_name}' must be a list")
+                if item_check is not None:
+                    for item in value:
+                        if item is not None:
+                            item_check(item)
+
+            return check_list
+
+        def check_type(value):
+            if not isinstance(value, origin_type):
+                raise ValidationError(f"'{param_name}' must be {origin_type.__name__}")
+
+        return check_type
+
+    @classmethod
+    def _compile_rule(cls, rule: tuple, param_name: str) -> Callable[[Any], None]:
+        """Compiles a (type, validator name, ...) rule."""
+        type_check = cls._compile_type(rule[0], param_name)
+        if len(rule) == 1 or rule[1] == "validate_list_type":
+            return type_check
+
+        validator_name = rule[1]
+        if validator_name == "validate_date":
+            extra_check = lambda value: cls.validate_date(value, param_name)
+        elif validator_name == "validate_date_list":
+            def extra_check(value):
+                for item in value:
+                    if not isinstance(item, str) or not is_valid_date(item):
+                        raise ValidationError(f"'element of {param_name}' must be in YYYY-MM-DD format")
+        elif validator_name == "validate_string_length":
+            extra_check = lambda value: cls.validate_string_length(value, 2, param_name)
+        elif validator_name.startswith("validate_enum"):
+            allowed_values = rule[2]
+            extra_check = lambda value: cls.validate_enum(value, allowed_values, param_name)
+        else:
+            raise ValueError(f"Unknown validator {validator_name} for {param_name}")
+
+        def check(value):
+            type_check(value)
+            extra_check(value)
+
+        return check
@@ -24,5 +24,10 @@ setup(
     install_requires=[
         "requests>=2.32.3",
     ],
+    extras_require={
+        "async": ["httpx>=0.24"],
+        "fast": ["orjson>=3.8"],
+        "http2": ["httpx[http2]>=0.24"],
+    },
     include_package_data=True,
 )
\ No newline at end of file
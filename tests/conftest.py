@@ -0,0 +1,28 @@
+import pytest
+
+from pytopvisor.services.transport import Transport, build_response
+
+EMPTY_RESULT = b'{"result": []}'
+
+
+class StubTransport(Transport):
+    """
+    Plays back queued replies, then answers with an empty result.
+
+    A reply is an exception to raise, a JSON body, or a (status, body) pair.
+    """
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+
+    def post(self, url, headers, data, timeout=None, stream=False):
+        reply = self.replies.pop(0) if self.replies else EMPTY_RESULT
+        if isinstance(reply, BaseException):
+            raise reply
+        status, body = reply if isinstance(reply, tuple) else (200, reply)
+        return build_response(url, status, {"Content-Type": "application/json"}, body)
+
+
+@pytest.fixture
+def stub_transport():
+    return StubTransport
@@ -0,0 +1,23 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pytopvisor.async_topvisor import AsyncTopvisor
+
+
+def test_run_task_with_stream_returns_async_iterator():
+    def handler(request):
+        return httpx.Response(200, json={"result": [{"id": 1}, {"id": 2}], "total": 2})
+
+    async def main():
+        async with AsyncTopvisor("1", "key", transport=httpx.MockTransport(handler)) as client:
+            records = await client.run_task("get_projects", stream=True)
+            return [record async for record in records]
+
+    assert asyncio.run(main()) == [{"id": 1}, {"id": 2}]
+
+
+def test_sync_transport_is_rejected(stub_transport):
+    with pytest.raises(TypeError, match="httpx.AsyncBaseTransport"):
+        AsyncTopvisor("1", "key", transport=stub_transport())
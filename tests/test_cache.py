@@ -0,0 +1,36 @@
+import threading
+
+import pytest
+
+from pytopvisor.topvisor import Topvisor
+from pytopvisor.utils.cache import ResponseCache, SQLiteCacheBackend
+
+
+def test_hits_and_misses_are_counted_across_threads():
+    cache = ResponseCache()
+    cache.set("/hit", None, {"result": []})
+    threads = [
+        threading.Thread(target=lambda: [cache.get(path, None) for _ in range(2000) for path in ("/hit", "/miss")])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats["hits"] == 16000
+    assert cache.stats["misses"] == 16000
+    assert cache.stats["hit_rate"] == 0.5
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_clients_of_different_accounts_do_not_share_responses(backend, tmp_path, stub_transport):
+    if backend == "sqlite":
+        cache = ResponseCache(backend=SQLiteCacheBackend(str(tmp_path / "cache.sqlite3")))
+    else:
+        cache = ResponseCache()
+    client_a = Topvisor("1", "key-a", cache=cache, transport=stub_transport(b'{"result": ["projects of A"]}'))
+    client_b = Topvisor("2", "key-b", cache=cache, transport=stub_transport(b'{"result": ["projects of B"]}'))
+    assert client_a.run_task("get_projects") == {"result": ["projects of A"]}
+    assert client_b.run_task("get_projects") == {"result": ["projects of B"]}
+    assert client_a.run_task("get_projects") == {"result": ["projects of A"]}
+    assert cache.stats["hits"] == 1
@@ -0,0 +1,99 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pytopvisor.services.api import TopvisorAPI
+from pytopvisor.services.async_api import AsyncTopvisorAPI
+from pytopvisor.utils.circuit_breaker import CircuitBreaker
+from pytopvisor.utils.exceptions import CircuitOpenError, ServerError
+from pytopvisor.utils.retry import RetryPolicy
+
+ENDPOINT = "/v2/json/get/projects_2/projects"
+
+
+class Interrupted(BaseException):
+    pass
+
+
+def open_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    return breaker
+
+
+def test_release_frees_half_open_trial():
+    breaker = open_breaker()
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.release()
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_interrupted_trial_does_not_keep_circuit_half_open(stub_transport):
+    breaker = open_breaker()
+    api = TopvisorAPI("1", "key", circuit_breaker=breaker, transport=stub_transport(Interrupted()))
+    with pytest.raises(Interrupted):
+        api.send_request(ENDPOINT, {})
+    assert api.send_request(ENDPOINT, {}) == {"result": []}
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_async_trial_does_not_keep_circuit_half_open():
+    async def handler(request):
+        if handler.calls == 0:
+            handler.calls += 1
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"result": []})
+
+    handler.calls = 0
+
+    async def main():
+        breaker = open_breaker()
+        api = AsyncTopvisorAPI("1", "key", circuit_breaker=breaker, transport=httpx.MockTransport(handler))
+        async with api:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(api.send_request(ENDPOINT, {}), 0.05)
+            assert await api.send_request(ENDPOINT, {}) == {"result": []}
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(main())
+
+
+def test_rejected_requests_are_passed_to_hooks(stub_transport):
+    events = []
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure()
+    api = TopvisorAPI("1", "key", circuit_breaker=breaker, transport=stub_transport(), hooks=[events.append])
+    with pytest.raises(CircuitOpenError):
+        api.send_request(ENDPOINT, {})
+    assert [event.error for event in events] == ["CircuitOpenError"]
+
+
+def test_gateway_errors_count_as_failures(stub_transport):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    api = TopvisorAPI(
+        "1",
+        "key",
+        circuit_breaker=breaker,
+        retry_policy=RetryPolicy(max_attempts=1),
+        transport=stub_transport((503, b""), (502, b"")),
+    )
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            api.send_request(ENDPOINT, {})
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_async_gateway_errors_are_server_errors():
+    async def main():
+        transport = httpx.MockTransport(lambda request: httpx.Response(504))
+        api = AsyncTopvisorAPI("1", "key", retry_policy=RetryPolicy(max_attempts=1), transport=transport)
+        async with api:
+            with pytest.raises(ServerError):
+                await api.send_request(ENDPOINT, {})
+
+    asyncio.run(main())
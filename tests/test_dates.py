@@ -0,0 +1,23 @@
+import pytest
+
+from pytopvisor.utils.dates import split_date_range
+
+
+@pytest.mark.parametrize(
+    "date1, date2, window_days, expected",
+    [
+        ("2024-01-01", "2024-01-01", 7, [("2024-01-01", "2024-01-01")]),
+        ("2024-01-01", "2024-01-03", 1, [("2024-01-01", "2024-01-01"), ("2024-01-02", "2024-01-02"), ("2024-01-03", "2024-01-03")]),
+        ("2024-01-01", "2024-01-14", 7, [("2024-01-01", "2024-01-07"), ("2024-01-08", "2024-01-14")]),
+        ("2024-01-01", "2024-01-15", 7, [("2024-01-01", "2024-01-07"), ("2024-01-08", "2024-01-14"), ("2024-01-15", "2024-01-15")]),
+        ("2024-02-27", "2024-03-02", 3, [("2024-02-27", "2024-02-29"), ("2024-03-01", "2024-03-02")]),
+        ("2024-01-10", "2024-01-01", 30, [("2024-01-01", "2024-01-10")]),
+    ],
+)
+def test_split_date_range(date1, date2, window_days, expected):
+    assert split_date_range(date1, date2, window_days) == expected
+
+
+def test_split_date_range_rejects_empty_windows():
+    with pytest.raises(ValueError):
+        split_date_range("2024-01-01", "2024-01-02", 0)
@@ -0,0 +1,42 @@
+import pytest
+
+from pytopvisor.services.registry import ENDPOINTS
+from pytopvisor.topvisor import Topvisor
+
+ARGUMENTS = {
+    "get_positions_summary": {"project_id": 1, "region_index": 1, "dates": ["2024-01-01", "2024-01-31"]},
+    "get_positions_summary_chart": {"project_id": 1, "region_index": 1, "date1": "2024-01-01", "date2": "2024-01-31"},
+    "get_positions_history": {"project_id": 1, "regions_indexes": [1], "date1": "2024-01-01", "date2": "2024-01-02"},
+    "get_snapshots_history": {"project_id": 1, "region_index": 1, "date1": "2024-01-01", "date2": "2024-01-02"},
+}
+
+
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def send_request(self, endpoint, payload, timeout=None):
+        self.calls.append("send_request")
+        return {"result": {}}
+
+    def fetch_all(self, endpoint, payload, limit=10000):
+        self.calls.append("fetch_all")
+
+    def iter_results(self, endpoint, payload, limit=10000):
+        self.calls.append("iter_results")
+
+    def iter_json_records(self, endpoint, payload, path=("result", "keywords")):
+        self.calls.append("iter_json_records")
+        return iter(())
+
+
+@pytest.mark.parametrize("operation", sorted(ARGUMENTS))
+def test_non_paginated_endpoints_are_sent_once(operation):
+    assert not ENDPOINTS[operation].paginated
+    client = Topvisor("1", "key")
+    client.api_client = recorder = RecordingClient()
+    client.service_factory.api_client = recorder
+    client.run_task(operation, fetch_all=True, **ARGUMENTS[operation])
+    client.run_task(operation, stream=True, **ARGUMENTS[operation])
+    expected_stream = "iter_json_records" if ENDPOINTS[operation].records_path else "send_request"
+    assert recorder.calls == ["send_request", expected_stream]
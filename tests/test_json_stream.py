@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from pytopvisor.utils.json_stream import JsonRecordStreamParser
+
+DOCUMENT = json.dumps(
+    {
+        "errors": None,
+        "result": {
+            "headers": {"dates": ["2024-01-01"]},
+            "existsDates": [1234, -5.5e3, 0, "2024-01-02", True, None, {"a": [1, 2]}, [3, "]"], 678],
+            "keywords": [{"id": 1, "name": 'ключ "1" \\ x'}, {"id": 22}],
+        },
+    },
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+def parse(chunks, path):
+    parser = JsonRecordStreamParser(path)
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items, parser.envelope
+
+
+@pytest.mark.parametrize("path", [("result", "existsDates"), ("result", "keywords")])
+def test_every_split_point_gives_the_same_items(path):
+    expected = json.loads(DOCUMENT)
+    items = expected["result"][path[1]]
+    expected["result"][path[1]] = []
+    for split in range(len(DOCUMENT) + 1):
+        assert parse([DOCUMENT[:split], DOCUMENT[split:]], path) == (items, expected), split
+
+
+def test_byte_by_byte():
+    chunks = [DOCUMENT[i:i + 1] for i in range(len(DOCUMENT))]
+    items, _ = parse(chunks, ("result", "existsDates"))
+    assert items == json.loads(DOCUMENT)["result"]["existsDates"]
+
+
+def test_number_split_across_chunks():
+    items, _ = parse([b'{"result": {"existsDates": [12', b"34, 5]}}"], ("result", "existsDates"))
+    assert items == [1234, 5]
+
+
+def test_truncated_body_raises():
+    with pytest.raises(ValueError):
+        parse([b'{"result": {"keywords": [{"id": 1'], ("result", "keywords"))
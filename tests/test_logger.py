@@ -0,0 +1,27 @@
+import logging
+
+from pytopvisor.utils.logger import LOGGER_NAME, Logger, logger
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_records_propagate_to_application_handlers_by_default():
+    root = logging.getLogger()
+    handler = ListHandler()
+    root.addHandler(handler)
+    try:
+        logger.error("Request failed: %s", "boom")
+    finally:
+        root.removeHandler(handler)
+    library_logger = logging.getLogger(LOGGER_NAME)
+    assert [record.getMessage() for record in handler.records] == ["Request failed: boom"]
+    assert library_logger.propagate
+    assert all(isinstance(h, logging.NullHandler) for h in library_logger.handlers)
+    assert Logger().listener is None
@@ -0,0 +1,108 @@
+import copy
+import json
+
+import pytest
+
+from pytopvisor.services.transport import Transport, build_response
+from pytopvisor.topvisor import Topvisor
+from pytopvisor.utils.merge import merge_positions_history
+from pytopvisor.utils.validators import ValidationError
+
+WINDOWS = [
+    {
+        "result": {
+            "headers": {"dates": ["2024-01-01", "2024-01-02"], "projects": [{"id": 1}]},
+            "existsDates": ["2024-01-02", "2024-01-01"],
+            "keywords": [
+                {"id": 10, "name": "a", "positionsData": {"2024-01-01:1:1": {"position": 3}}},
+                {"name": "b", "positionsData": {"2024-01-01:1:1": {"position": 7}}},
+            ],
+        }
+    },
+    {
+        "result": {
+            "headers": {"dates": ["2024-01-02", "2024-01-03"], "projects": [{"id": 1}]},
+            "existsDates": ["2024-01-03", "2024-01-02"],
+            "keywords": [
+                {"id": 10, "name": "a", "positionsData": {"2024-01-03:1:1": {"position": 2}}},
+                {"name": "b", "positionsData": {"2024-01-03:1:1": {"position": 5}}},
+                {"id": 11, "name": "c", "positionsData": None},
+            ],
+        }
+    },
+]
+
+
+class WindowTransport(Transport):
+    """
+    Answers every window request with the response of the window starting at its date1.
+    """
+
+    def __init__(self, responses):
+        self.responses = {response["result"]["headers"]["dates"][0]: response for response in responses}
+        self.requests = []
+
+    def post(self, url, headers, data, timeout=None, stream=False):
+        payload = json.loads(data)
+        self.requests.append((payload["date1"], payload["date2"]))
+        body = json.dumps(self.responses[payload["date1"]]).encode()
+        return build_response(url, 200, {"Content-Type": "application/json"}, body)
+
+
+def test_merge_positions_history():
+    merged = merge_positions_history(WINDOWS)["result"]
+    assert merged["headers"] == {"dates": ["2024-01-01", "2024-01-02", "2024-01-03"], "projects": [{"id": 1}]}
+    assert merged["existsDates"] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert merged["keywords"] == [
+        {
+            "id": 10,
+            "name": "a",
+            "positionsData": {"2024-01-01:1:1": {"position": 3}, "2024-01-03:1:1": {"position": 2}},
+        },
+        {"name": "b", "positionsData": {"2024-01-01:1:1": {"position": 7}, "2024-01-03:1:1": {"position": 5}}},
+        {"id": 11, "name": "c", "positionsData": {}},
+    ]
+
+
+def test_merge_does_not_modify_responses():
+    responses = copy.deepcopy(WINDOWS)
+    merge_positions_history(responses)
+    assert responses == WINDOWS
+
+
+def test_merge_of_no_responses():
+    assert merge_positions_history([]) == {"result": {}}
+
+
+def test_history_is_fetched_in_windows_and_merged():
+    transport = WindowTransport([
+        {"result": {"headers": {"dates": ["2024-01-01"]}, "keywords": [{"id": 1, "positionsData": {"a": 1}}]}},
+        {"result": {"headers": {"dates": ["2024-01-03"]}, "keywords": [{"id": 1, "positionsData": {"b": 2}}]}},
+    ])
+    client = Topvisor("1", "key", transport=transport)
+    result = client.run_task(
+        "get_positions_history",
+        project_id=1,
+        regions_indexes=[1],
+        date1="2024-01-01",
+        date2="2024-01-04",
+        window_days=2,
+    )
+    assert sorted(transport.requests) == [("2024-01-01", "2024-01-02"), ("2024-01-03", "2024-01-04")]
+    assert result["result"]["headers"]["dates"] == ["2024-01-01", "2024-01-03"]
+    assert result["result"]["keywords"] == [{"id": 1, "positionsData": {"a": 1, "b": 2}}]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"window_days": 0},
+        {"window_days": 2, "date2": None},
+        {"window_days": 2, "fetch_all": True},
+    ],
+)
+def test_invalid_window_options(options, stub_transport):
+    client = Topvisor("1", "key", transport=stub_transport())
+    kwargs = {"project_id": 1, "regions_indexes": [1], "date1": "2024-01-01", "date2": "2024-01-04", **options}
+    with pytest.raises(ValidationError):
+        client.run_task("get_positions_history", **kwargs)
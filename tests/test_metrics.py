@@ -0,0 +1,21 @@
+from pytopvisor.services.api import TopvisorAPI
+from pytopvisor.utils.retry import RetryPolicy
+
+ENDPOINT = "/v2/json/get/positions_2/history"
+ERROR_BODY = b'{"errors": [{"code": 503, "string": "Busy"}], "result": {"keywords": []}, "padding": "' + b"x" * 500 + b'"}'
+BODY = b'{"result": {"keywords": [{"id": 1}, {"id": 2}]}}'
+
+
+def test_streamed_event_describes_the_last_attempt(stub_transport):
+    events = []
+    api = TopvisorAPI(
+        "1",
+        "key",
+        transport=stub_transport(ERROR_BODY, BODY),
+        retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+        hooks=[events.append],
+    )
+    assert list(api.iter_json_records(ENDPOINT, {})) == [{"id": 1}, {"id": 2}]
+    [event] = events
+    assert event.ok and event.retries == 1
+    assert event.response_bytes == event.wire_bytes == len(BODY)
@@ -0,0 +1,132 @@
+import pytest
+
+from pytopvisor.utils.payload import PayloadFactory
+
+DATES = ["2024-01-01", "2024-01-31"]
+
+
+@pytest.mark.parametrize(
+    "method, args, kwargs, expected",
+    [
+        (
+            "projects_get_projects_payload",
+            (),
+            {"show_site_stat": True, "show_searchers_and_regions": 2, "limit": 10},
+            {"show_site_stat": True, "show_searchers_and_regions": 2, "limit": 10},
+        ),
+        ("projects_get_projects_payload", (), {}, {}),
+        (
+            "projects_get_competitors_payload",
+            (5,),
+            {"only_enabled": True, "include_project": False},
+            {"project_id": 5, "only_enabled": True, "include_project": False},
+        ),
+        ("projects_get_competitors_payload", (None,), {}, {"project_id": None}),
+        (
+            "positions_get_history_payload",
+            (1, [643]),
+            {
+                "date1": "2024-01-01",
+                "date2": "2024-01-31",
+                "only_exists_first_date": False,
+                "show_headers": True,
+                "show_exists_dates": True,
+                "show_visitors": False,
+                "positions_fields": ["position"],
+                "offset": 100,
+            },
+            {
+                "project_id": 1,
+                "regions_indexes": [643],
+                "date1": "2024-01-01",
+                "date2": "2024-01-31",
+                "type_range": 2,
+                "only_exists_first_date": 0,
+                "show_headers": 1,
+                "show_exists_dates": 1,
+                "show_visitors": 0,
+                "positions_fields": ["position"],
+                "offset": 100,
+            },
+        ),
+        (
+            "positions_get_history_payload",
+            (1, [643]),
+            {"dates": DATES, "type_range": None},
+            {"project_id": 1, "regions_indexes": [643], "dates": DATES},
+        ),
+        (
+            "positions_get_summary_payload",
+            (1, 643, DATES),
+            {"competitor_id": 7, "show_dynamics": True, "show_tops": False, "show_median": True},
+            {
+                "project_id": 1,
+                "region_index": 643,
+                "dates": DATES,
+                "competitor_id": 7,
+                "show_dynamics": 1,
+                "show_tops": 0,
+                "show_median": 1,
+            },
+        ),
+        (
+            "positions_get_summary_chart_payload",
+            (1, 643),
+            {"date1": "2024-01-01", "date2": "2024-01-31", "show_avg": True, "competitors_ids": [1, 2]},
+            {
+                "project_id": 1,
+                "region_index": 643,
+                "date1": "2024-01-01",
+                "date2": "2024-01-31",
+                "competitors_ids": [1, 2],
+                "type_range": 2,
+                "show_avg": 1,
+            },
+        ),
+        (
+            "positions_get_searchers_regions_payload",
+            (1,),
+            {"searcher_key": 0, "name_key": "Moscow", "lang": "ru", "device": 0},
+            {"project_id": 1, "searcher_key": 0, "name/key": "Moscow", "lang": "ru", "device": 0},
+        ),
+        (
+            "snapshots_get_history_payload",
+            (1, 643),
+            {"dates": DATES, "type_range": 0, "show_exists_dates": True, "show_ams": False, "fields": ["id"]},
+            {
+                "project_id": 1,
+                "region_index": 643,
+                "dates": DATES,
+                "type_range": 0,
+                "show_exists_dates": 1,
+                "show_ams": 0,
+                "fields": ["id"],
+            },
+        ),
+    ],
+)
+def test_payload(method, args, kwargs, expected):
+    payload = getattr(PayloadFactory, method)(*args, **kwargs)
+    assert payload == expected
+    assert list(payload) == list(expected)
+
+
+def test_required_parameters_are_enforced():
+    with pytest.raises(TypeError):
+        PayloadFactory.positions_get_history_payload(regions_indexes=[643])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"limit": "10"}, {"fields": "id"}, {"filters": ["name"]}, {"orders": {}}],
+)
+def test_universal_params_are_checked(kwargs):
+    with pytest.raises(ValueError):
+        PayloadFactory.projects_get_projects_payload(**kwargs)
+
+
+def test_template_matches_direct_build():
+    template = PayloadFactory.template("positions_get_summary", region_index=643, dates=DATES, show_tops=True)
+    assert template.build(project_id=1) == PayloadFactory.positions_get_summary_payload(
+        1, 643, DATES, show_tops=True
+    )
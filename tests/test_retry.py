@@ -0,0 +1,17 @@
+from pytopvisor.utils.retry import RetryPolicy
+
+
+def test_retry_after_is_not_clipped_to_max_backoff():
+    policy = RetryPolicy(max_backoff=30)
+    assert policy.get_delay(1, retry_after=60) == 60
+
+
+def test_retry_after_has_its_own_cap():
+    policy = RetryPolicy(max_retry_after=120)
+    assert policy.get_delay(1, retry_after=3600) == 120
+    assert policy.get_delay(1, retry_after=-5) == 0
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
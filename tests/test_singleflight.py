@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from pytopvisor.utils.singleflight import AsyncSingleFlight
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def main():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert calls == [1]
+
+    asyncio.run(main())
+
+
+def test_shared_call_is_cancelled_with_its_last_waiter():
+    async def main():
+        flight = AsyncSingleFlight()
+        finished = []
+
+        async def fetch():
+            await asyncio.sleep(10)
+            finished.append(1)
+
+        callers = [asyncio.ensure_future(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert not flight._calls and not finished
+
+    asyncio.run(main())
+
+
+def test_errors_are_shared():
+    async def main():
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+        assert [type(result) for result in results] == [ValueError, ValueError]
+        assert not flight._calls
+
+    asyncio.run(main())